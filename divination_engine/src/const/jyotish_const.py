@@ -215,6 +215,9 @@ DASHA_ORDER = [
     Graha.BUDHA,     # 17年
 ]
 
+# ダシャー支配星 → DASHA_ORDER内のインデックス
+DASHA_ORDER_INDEX = {g: i for i, g in enumerate(DASHA_ORDER)}
+
 # 総周期（年）
 TOTAL_DASHA_YEARS = 120
 
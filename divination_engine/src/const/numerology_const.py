@@ -57,6 +57,10 @@ MASTER_NUMBERS = {11, 22, 33, 44}
 # Karmic Debt Numbers
 KARMIC_NUMBERS = {13, 14, 16, 19}
 
+# ビットマスク版（ビット位置 = 数値。(MASK >> n) & 1 で所属判定）
+MASTER_MASK = sum(1 << n for n in MASTER_NUMBERS)
+KARMIC_MASK = sum(1 << n for n in KARMIC_NUMBERS)
+
 
 # ============================================
 # 惑星支配星マッピング
@@ -173,6 +177,22 @@ FALL = {
     'Pluto': 'Libra'
 }
 
+# 品位名（DIGNITY_TABLEの値 = このタプルのインデックス）
+DIGNITY_NAMES = ('Domicile', 'Exaltation', 'Detriment', 'Fall')
+
+
+def _build_dignity_table():
+    """(惑星名, 星座名) → 品位コードの表を作成（複数に該当する組はDIGNITY_NAMESの順で優先）"""
+    table = {}
+    for code, dignities in enumerate((DOMICILE, EXALTATION, DETRIMENT, FALL)):
+        for planet, signs in dignities.items():
+            for sign in ((signs,) if isinstance(signs, str) else signs):
+                table.setdefault((planet, sign), code)
+    return table
+
+
+DIGNITY_TABLE = _build_dignity_table()
+
 
 # ============================================
 # 数字の意味・キーワード
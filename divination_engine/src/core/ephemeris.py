@@ -53,7 +53,7 @@ ZODIAC_SIGNS_EN = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanetData:
     """惑星データ"""
     planet_id: int
@@ -68,7 +68,7 @@ class PlanetData:
     is_retrograde: bool       # 逆行中フラグ
 
 
-@dataclass  
+@dataclass(slots=True)
 class HouseData:
     """ハウスデータ"""
     cusps: List[float]        # 12ハウスのカスプ度数
@@ -0,0 +1,22 @@
+"""
+JITコンパイル補助
+numbaがインストールされていれば@njit/prangeをそのまま提供し、
+なければ通常のPython関数として動作するフォールバックを提供する
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """numba未導入時のフォールバック（関数をそのまま返す）"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+
+__all__ = ['njit', 'prange', 'NUMBA_AVAILABLE']
@@ -157,10 +157,15 @@ class ZiweiAPI:
             (p for p in chart.palaces if p.palace_type == "命宮"), 
             None
         )
-        body_palace = next(
-            (p for p in chart.palaces if p.index == chart.body_palace_index),
-            None
-        )
+        # 宮・大限は宮のインデックスで引くため一度だけ索引を作る（同じインデックスは先頭を採用）
+        palace_by_index = {}
+        for p in chart.palaces:
+            palace_by_index.setdefault(p.index, p)
+        luck_by_index = {}
+        for d in decade_luck:
+            luck_by_index.setdefault(d["palace_index"], d)
+        
+        body_palace = palace_by_index.get(chart.body_palace_index)
         
         life_master = ""
         body_master = ""
@@ -215,10 +220,7 @@ class ZiweiAPI:
             }
             
             # 大限情報を追加
-            luck = next(
-                (d for d in decade_luck if d["palace_index"] == palace.index),
-                None
-            )
+            luck = luck_by_index.get(palace.index)
             if luck:
                 palace_data["decade_luck"] = luck["period"]
             
@@ -0,0 +1,59 @@
+"""
+ジョーティシュ計算の数値カーネル
+Jyotish numeric kernels
+
+ラシ・ナクシャトラ・ナヴァムシャの区分計算をまとめた純粋な算術関数。
+numbaがインストールされていれば@njitでコンパイルし、なければ通常のPython関数として動作する。
+"""
+
+from typing import Tuple
+
+try:
+    from ...const import jyotish_const as jc
+    from ...core.jit import njit
+except ImportError:
+    import sys
+    import os
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+    from src.const import jyotish_const as jc
+    from src.core.jit import njit
+
+
+# 定数はタプルにしてnumbaのコンパイル時定数として扱えるようにする
+_NAKSHATRA_SPAN = jc.NAKSHATRA_SPAN
+_PADA_SPAN = jc.PADA_SPAN
+_NAVAMSHA_SPAN = 30.0 / 9.0
+_NAVAMSHA_START = tuple(int(jc.NAVAMSHA_START[jc.Rashi(r)]) for r in range(12))
+
+
+@njit(cache=True)
+def navamsha_from_longitude(longitude: float) -> int:
+    """恒星黄経からナヴァムシャのラシインデックス（0-11）を計算"""
+    rashi = int(longitude / 30) % 12
+    navamsha_division = int((longitude % 30) / _NAVAMSHA_SPAN)
+    return (_NAVAMSHA_START[rashi] + navamsha_division) % 12
+
+
+@njit(cache=True)
+def sidereal_divisions(longitude: float) -> Tuple[int, float, int, int, int]:
+    """
+    恒星黄経から各区分を一括計算
+
+    Args:
+        longitude: 恒星黄経
+
+    Returns:
+        (ラシ, ラシ内度数, ナクシャトラ, パダ, ナヴァムシャのラシ)
+    """
+    rashi = int(longitude / 30) % 12
+    degree_in_rashi = longitude % 30
+
+    nakshatra = int(longitude / _NAKSHATRA_SPAN) % 27
+    pada = int((longitude % _NAKSHATRA_SPAN) / _PADA_SPAN) + 1
+    if pada > 4:
+        pada = 4
+
+    navamsha_division = int(degree_in_rashi / _NAVAMSHA_SPAN)
+    navamsha_rashi = (_NAVAMSHA_START[rashi] + navamsha_division) % 12
+
+    return rashi, degree_in_rashi, nakshatra, pada, navamsha_rashi
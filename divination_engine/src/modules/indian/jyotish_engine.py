@@ -6,8 +6,10 @@ pyswissephによる恒星黄道帯計算、アヤナムサ、ナクシャトラ
 """
 
 import math
+import sys
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 
 try:
@@ -23,19 +25,74 @@ except ImportError:
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
     from src.const import jyotish_const as jc
 
+try:
+    from ._jit_kernels import navamsha_from_longitude, sidereal_divisions
+except ImportError:
+    from src.modules.indian._jit_kernels import navamsha_from_longitude, sidereal_divisions
+
+
+# グラハ → calculate_sidereal_planetsの返却リスト内インデックス
+GRAHA_INDEX: Dict[jc.Graha, int] = {g: i for i, g in enumerate(jc.Graha)}
+
+# 表示名の事前構築テーブル（to_dictでの辞書参照を省く）
+# グラハ → (英語名, 日本語名, サンスクリット名)
+_GRAHA_LABELS: Dict[jc.Graha, Tuple[str, str, str]] = {
+    g: (jc.GRAHA_NAMES_EN[g], jc.GRAHA_NAMES_JA[g], jc.GRAHA_NAMES_SANSKRIT[g])
+    for g in jc.Graha
+}
+# ラシインデックス → (英語名, サンスクリット名)
+_RASHI_LABELS: Tuple[Tuple[str, str], ...] = tuple(
+    (sys.intern(en), sys.intern(sa))
+    for en, sa in zip(jc.RASHI_NAMES_EN, jc.RASHI_NAMES_SANSKRIT)
+)
+
+def _mean_rahu_longitude(jd: float) -> Tuple[float, float]:
+    """
+    平均ノード（ラーフ）のトロピカル黄経と速度を解析式で計算
+
+    月の平均昇交点の多項式（Chapront et al.）を使用し、swe.calc_utを経由しない。
+    Swiss Ephemerisの平均ノードとの差は1秒角未満。
+
+    Args:
+        jd: ユリウス日（UT）
+
+    Returns:
+        (トロピカル黄経, 速度（度/日）)
+    """
+    t = (jd + swe.deltat(jd) - 2451545.0) / 36525.0
+    omega = (
+        125.04455501
+        - 1934.1361849 * t
+        + 0.0020762 * t * t
+        + t ** 3 / 467410.0
+        - t ** 4 / 60616000.0
+    )
+    speed = (
+        -1934.1361849
+        + 0.0041524 * t
+        + 3.0 * t * t / 467410.0
+        - 4.0 * t ** 3 / 60616000.0
+    ) / 36525.0
+    return omega % 360, speed
+
+
+def _fmt_date(d: datetime) -> str:
+    """日付を YYYY-MM-DD 形式に整形（strftime より高速）"""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
 
 # ============================================
 # データ構造
 # ============================================
 
-@dataclass
+@dataclass(slots=True)
 class GrahaPosition:
     """グラハ（惑星）の位置情報"""
     graha: jc.Graha
     longitude: float           # 恒星黄経（サイデリアル）
     latitude: float            # 黄緯
-    speed: float               # 速度（度/日）
-    is_retrograde: bool        # 逆行
+    speed: Optional[float]     # 速度（度/日、need_speed=FalseではNone）
+    is_retrograde: Optional[bool]  # 逆行（need_speed=FalseではNone）
     rashi: int                 # ラシインデックス（0-11）
     rashi_name: str            # ラシ名
     degree_in_rashi: float     # ラシ内の度数（0-30）
@@ -44,29 +101,55 @@ class GrahaPosition:
     pada: int                  # パダ（1-4）
     navamsha_rashi: int        # ナヴァムシャのラシ（0-11）
     dignity: str               # 品位（高揚/減衰/ムーラトリコーナ/自室/中立）
+    # 表示名（英語名, 日本語名, サンスクリット名, ラシ英語名, ラシサンスクリット名,
+    #         D9英語名, D9サンスクリット名）
+    names: Tuple[str, ...] = field(default=(), repr=False, compare=False)
+    
+    def __post_init__(self):
+        if not self.names:
+            self.names = (
+                _GRAHA_LABELS[self.graha]
+                + _RASHI_LABELS[self.rashi]
+                + _RASHI_LABELS[self.navamsha_rashi]
+            )
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, rounded: bool = True) -> Dict[str, Any]:
+        """
+        辞書に変換
+
+        Args:
+            rounded: Falseの場合は数値を丸めずにそのまま出力（丸めは利用側で行う）
+        """
+        names = self.names
+        if rounded:
+            longitude = round(self.longitude, 4)
+            degree = round(self.degree_in_rashi, 2)
+            speed = round(self.speed, 4) if self.speed is not None else None
+        else:
+            longitude = self.longitude
+            degree = self.degree_in_rashi
+            speed = self.speed
         return {
-            "id": jc.GRAHA_NAMES_EN[self.graha],
-            "name_ja": jc.GRAHA_NAMES_JA[self.graha],
-            "name_sanskrit": jc.GRAHA_NAMES_SANSKRIT[self.graha],
-            "longitude": round(self.longitude, 4),
-            "sign": jc.RASHI_NAMES_EN[self.rashi],
-            "sign_sanskrit": jc.RASHI_NAMES_SANSKRIT[self.rashi],
-            "degree": round(self.degree_in_rashi, 2),
+            "id": names[0],
+            "name_ja": names[1],
+            "name_sanskrit": names[2],
+            "longitude": longitude,
+            "sign": names[3],
+            "sign_sanskrit": names[4],
+            "degree": degree,
             "nakshatra": self.nakshatra_name,
             "nakshatra_index": self.nakshatra,
             "pada": self.pada,
             "house_d1": self.rashi + 1,
-            "sign_d9": jc.RASHI_NAMES_EN[self.navamsha_rashi],
-            "sign_d9_sanskrit": jc.RASHI_NAMES_SANSKRIT[self.navamsha_rashi],
+            "sign_d9": names[5],
+            "sign_d9_sanskrit": names[6],
             "is_retrograde": self.is_retrograde,
             "dignity": self.dignity,
-            "speed": round(self.speed, 4)
+            "speed": speed
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class JyotishChart:
     """ジョーティシュチャート"""
     birth_datetime: datetime
@@ -85,7 +168,18 @@ class JyotishChart:
     d1_chart: Dict[int, List[str]] = field(default_factory=dict)  # ラシ→グラハリスト
     d9_chart: Dict[int, List[str]] = field(default_factory=dict)  # ナヴァムシャ
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, rounded: bool = True) -> Dict[str, Any]:
+        """
+        辞書に変換
+
+        Args:
+            rounded: Falseの場合は数値を丸めずにそのまま出力（丸めは利用側で行う）
+        """
+        ayanamsa_val = self.ayanamsa_value
+        asc_degree = self.lagna % 30
+        if rounded:
+            ayanamsa_val = round(ayanamsa_val, 4)
+            asc_degree = round(asc_degree, 2)
         return {
             "meta": {
                 "datetime": self.birth_datetime.isoformat(),
@@ -93,14 +187,14 @@ class JyotishChart:
                 "longitude": self.longitude,
                 "timezone_offset": self.timezone_offset,
                 "ayanamsa": self.ayanamsa_mode,
-                "ayanamsa_val": round(self.ayanamsa_value, 4),
+                "ayanamsa_val": ayanamsa_val,
                 "ascendant": {
                     "sign": jc.RASHI_NAMES_EN[self.lagna_rashi],
                     "sign_sanskrit": jc.RASHI_NAMES_SANSKRIT[self.lagna_rashi],
-                    "degree": round(self.lagna % 30, 2)
+                    "degree": asc_degree
                 }
             },
-            "planets": [g.to_dict() for g in self.grahas],
+            "planets": [g.to_dict(rounded) for g in self.grahas],
             "charts": {
                 "D1": self.d1_chart,
                 "D9": self.d9_chart
@@ -119,21 +213,34 @@ class VedicAstroCore:
     恒星黄道帯（Sidereal Zodiac）でのグラハ位置計算
     """
     
-    def __init__(self, ayanamsa: jc.AyanamsaMode = jc.DEFAULT_AYANAMSA):
+    def __init__(
+        self,
+        ayanamsa: jc.AyanamsaMode = jc.DEFAULT_AYANAMSA,
+        need_speed: bool = True
+    ):
         """
         初期化
         
         Args:
             ayanamsa: アヤナムサモード
+            need_speed: 速度を計算するか。Falseの場合はFLG_SPEEDを省略して高速化し、
+                        speed・is_retrogradeはNone（不明）となる。
+                        平均ノード（ラーフ・ケートゥ）の速度は解析式で常に計算される
         """
         self.ayanamsa = ayanamsa
+        self.need_speed = need_speed
+        # 恒星黄道帯フラグ
+        self._calc_flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL
+        if need_speed:
+            self._calc_flags |= swe.FLG_SPEED
         swe.set_ephe_path(None)
     
     def datetime_to_jd(self, dt: datetime) -> float:
         """datetimeをユリウス日に変換"""
-        if dt.tzinfo is not None:
+        # 既にUTCならastimezoneを省略
+        if dt.tzinfo is not None and dt.tzinfo is not timezone.utc:
             dt = dt.astimezone(timezone.utc)
-        hour_decimal = dt.hour + dt.minute / 60.0 + dt.second / 3600.0
+        hour_decimal = (dt.hour * 3600 + dt.minute * 60 + dt.second) / 3600.0
         return swe.julday(dt.year, dt.month, dt.day, hour_decimal)
     
     def set_ayanamsa(self, mode: jc.AyanamsaMode):
@@ -177,7 +284,7 @@ class VedicAstroCore:
         swe.set_sid_mode(self.ayanamsa.value)
         ayanamsa_val = swe.get_ayanamsa_ut(jd)
         
-        positions = []
+        positions: List[Optional[GrahaPosition]] = [None] * len(GRAHA_INDEX)
         
         for graha in jc.Graha:
             if graha == jc.Graha.KETU:
@@ -186,29 +293,36 @@ class VedicAstroCore:
             
             # ノードの種類を選択
             if graha == jc.Graha.RAHU:
-                swe_id = 11 if use_true_node else 10
+                if not use_true_node:
+                    # 平均ノードは解析式で計算（天体暦の呼び出しを省略）
+                    tropical_lon, speed = _mean_rahu_longitude(jd)
+                    longitude = (tropical_lon - ayanamsa_val) % 360
+                    positions[GRAHA_INDEX[graha]] = self._create_graha_position(
+                        graha, longitude, 0.0, speed
+                    )
+                    continue
+                swe_id = 11
             else:
                 swe_id = jc.GRAHA_SWE_ID[graha]
             
-            # 恒星黄道帯フラグ
-            flags = swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_SIDEREAL
-            
-            result, _ = swe.calc_ut(jd, swe_id, flags)
+            result, _ = swe.calc_ut(jd, swe_id, self._calc_flags)
             
             longitude = result[0]
             latitude = result[1]
-            speed = result[3]
+            # FLG_SPEEDなしでは速度が0.0で返るため、順行と誤認されないようNoneとする
+            speed = result[3] if self.need_speed else None
             
             pos = self._create_graha_position(graha, longitude, latitude, speed)
-            positions.append(pos)
+            positions[GRAHA_INDEX[graha]] = pos
         
         # ケートゥを追加（ラーフの対向）
-        rahu = next(p for p in positions if p.graha == jc.Graha.RAHU)
+        rahu = positions[GRAHA_INDEX[jc.Graha.RAHU]]
         ketu_lon = (rahu.longitude + 180) % 360
         ketu_pos = self._create_graha_position(
-            jc.Graha.KETU, ketu_lon, -rahu.latitude, -rahu.speed
+            jc.Graha.KETU, ketu_lon, -rahu.latitude,
+            -rahu.speed if rahu.speed is not None else None
         )
-        positions.append(ketu_pos)
+        positions[GRAHA_INDEX[jc.Graha.KETU]] = ketu_pos
         
         return positions
     
@@ -217,18 +331,11 @@ class VedicAstroCore:
         graha: jc.Graha,
         longitude: float,
         latitude: float,
-        speed: float
+        speed: Optional[float]
     ) -> GrahaPosition:
         """GrahaPositionオブジェクトを作成"""
-        # ラシ
-        rashi = jc.get_rashi_from_longitude(longitude)
-        degree_in_rashi = jc.get_degree_in_rashi(longitude)
-        
-        # ナクシャトラ
-        nakshatra, pada = jc.get_nakshatra_from_longitude(longitude)
-        
-        # ナヴァムシャ
-        navamsha_rashi = self.calculate_navamsha(longitude)
+        # ラシ・ナクシャトラ・ナヴァムシャを一括計算
+        rashi, degree_in_rashi, nakshatra, pada, navamsha_rashi = sidereal_divisions(longitude)
         
         # 品位判定
         dignity = self._determine_dignity(graha, rashi, degree_in_rashi)
@@ -238,7 +345,7 @@ class VedicAstroCore:
             longitude=longitude,
             latitude=latitude,
             speed=speed,
-            is_retrograde=speed < 0,
+            is_retrograde=speed < 0 if speed is not None else None,
             rashi=rashi,
             rashi_name=jc.RASHI_NAMES_EN[rashi],
             degree_in_rashi=degree_in_rashi,
@@ -317,19 +424,8 @@ class VedicAstroCore:
         Returns:
             ナヴァムシャのラシインデックス（0-11）
         """
-        rashi = jc.get_rashi_from_longitude(longitude)
-        degree_in_rashi = jc.get_degree_in_rashi(longitude)
-        
-        # サイン内を9分割（各3°20' = 3.333...°）
-        navamsha_division = int(degree_in_rashi / (30.0 / 9.0))
-        
-        # エレメントに応じた開始サインを取得
-        start_rashi = jc.NAVAMSHA_START[jc.Rashi(rashi)]
-        
-        # ナヴァムシャ・サインを計算
-        navamsha_rashi = (start_rashi + navamsha_division) % 12
-        
-        return navamsha_rashi
+        # サイン内を9分割（各3°20'）し、エレメントに応じた開始サインから数える
+        return navamsha_from_longitude(longitude)
     
     def get_nakshatra_info(self, longitude: float) -> Dict[str, Any]:
         """
@@ -384,6 +480,25 @@ class DashaSystem:
         Returns:
             マハダシャーリスト（アンタルダシャー含む）
         """
+        return list(self.iter_vimshottari(moon_longitude, birth_date))
+    
+    def iter_vimshottari(
+        self,
+        moon_longitude: float,
+        birth_date: datetime
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        ヴィムショッタリ・ダシャーを順に生成
+        
+        必要な期間数だけ取り出せば、残りのマハダシャー（とアンタルダシャー）は計算されない。
+        
+        Args:
+            moon_longitude: 月の恒星黄経
+            birth_date: 生年月日
+            
+        Yields:
+            マハダシャー（アンタルダシャー含む）
+        """
         # 月のナクシャトラ
         nakshatra_idx, pada = jc.get_nakshatra_from_longitude(moon_longitude)
         nakshatra_lord = jc.NAKSHATRA_LORDS[nakshatra_idx]
@@ -396,9 +511,8 @@ class DashaSystem:
         balance = first_dasha_years * (1 - progress)
         
         # ダシャーの開始インデックスを特定
-        start_idx = jc.DASHA_ORDER.index(nakshatra_lord)
+        start_idx = jc.DASHA_ORDER_INDEX[nakshatra_lord]
         
-        dashas = []
         current_date = birth_date
         
         # 120年分のダシャーを生成
@@ -418,23 +532,21 @@ class DashaSystem:
                 # アンタルダシャーを計算
                 sub_periods = self._calculate_antardasha(lord, current_date, end_date)
                 
-                dashas.append({
+                yield {
                     "lord": jc.GRAHA_NAMES_EN[lord],
                     "lord_ja": jc.GRAHA_NAMES_JA[lord],
-                    "start_date": current_date.strftime("%Y-%m-%d"),
-                    "end_date": end_date.strftime("%Y-%m-%d"),
+                    "start_date": _fmt_date(current_date),
+                    "end_date": _fmt_date(end_date),
                     "years": round(years, 2),
                     "level": 1,
                     "sub_periods": sub_periods
-                })
+                }
                 
                 current_date = end_date
                 
                 # 200年を超えたら終了
                 if (current_date - birth_date).days > 200 * 365.25:
-                    return dashas
-        
-        return dashas
+                    return
     
     def _calculate_antardasha(
         self,
@@ -460,7 +572,7 @@ class DashaSystem:
         current_date = start_date
         
         # マハダシャー支配星から開始
-        start_idx = jc.DASHA_ORDER.index(maha_lord)
+        start_idx = jc.DASHA_ORDER_INDEX[maha_lord]
         
         for i in range(9):
             idx = (start_idx + i) % 9
@@ -476,8 +588,8 @@ class DashaSystem:
             sub_periods.append({
                 "lord": jc.GRAHA_NAMES_EN[antar_lord],
                 "lord_ja": jc.GRAHA_NAMES_JA[antar_lord],
-                "start_date": current_date.strftime("%Y-%m-%d"),
-                "end_date": antar_end.strftime("%Y-%m-%d"),
+                "start_date": _fmt_date(current_date),
+                "end_date": _fmt_date(antar_end),
                 "level": 2
             })
             
@@ -500,7 +612,7 @@ class DashaSystem:
         Returns:
             現在のマハダシャーとアンタルダシャー
         """
-        target_str = target_date.strftime("%Y-%m-%d")
+        target_str = _fmt_date(target_date)
         
         for maha in dashas:
             if maha["start_date"] <= target_str <= maha["end_date"]:
@@ -528,8 +640,12 @@ class JyotishAPI:
     ジョーティシュ統合API
     """
     
-    def __init__(self, ayanamsa: jc.AyanamsaMode = jc.DEFAULT_AYANAMSA):
-        self.core = VedicAstroCore(ayanamsa)
+    def __init__(
+        self,
+        ayanamsa: jc.AyanamsaMode = jc.DEFAULT_AYANAMSA,
+        need_speed: bool = True
+    ):
+        self.core = VedicAstroCore(ayanamsa, need_speed)
         self.dasha = DashaSystem()
     
     def generate_chart(
@@ -582,18 +698,30 @@ class JyotishAPI:
         # グラハ位置計算
         grahas = self.core.calculate_sidereal_planets(jd, lat, lon, use_true_node)
         
-        # D1チャート（ラシチャート）
-        d1_chart = self._build_chart_map(grahas)
-        
-        # D9チャート（ナヴァムシャ）
-        d9_chart = self._build_navamsha_map(grahas)
+        # D1チャート（ラシチャート）とD9チャート（ナヴァムシャ）を一度の走査で構築
+        d1_chart = {i: [] for i in range(12)}
+        d9_chart = {i: [] for i in range(12)}
+        for g in grahas:
+            name = jc.GRAHA_NAMES_EN[g.graha]
+            d1_chart[g.rashi].append(name)
+            d9_chart[g.navamsha_rashi].append(name)
         
         # ダシャー計算
-        moon = next(g for g in grahas if g.graha == jc.Graha.CHANDRA)
-        dashas = self.dasha.calculate_vimshottari(moon.longitude, local_dt)
-        
-        # 現在のダシャー
-        current_dasha = self.dasha.get_current_dasha(dashas, datetime.now())
+        moon = grahas[GRAHA_INDEX[jc.Graha.CHANDRA]]
+        dasha_iter = self.dasha.iter_vimshottari(moon.longitude, local_dt)
+        dashas = list(islice(dasha_iter, 12))  # 最初の12期間
+        
+        # 現在のダシャー（12期間を超える場合のみ続きを生成して探索）
+        now = datetime.now()
+        now_str = _fmt_date(now)
+        search_dashas = dashas
+        if dashas and dashas[-1]["end_date"] < now_str:
+            search_dashas = list(dashas)
+            for maha in dasha_iter:
+                search_dashas.append(maha)
+                if maha["end_date"] >= now_str:
+                    break
+        current_dasha = self.dasha.get_current_dasha(search_dashas, now)
         
         # チャート構築
         chart = JyotishChart(
@@ -611,7 +739,7 @@ class JyotishAPI:
         )
         
         result = chart.to_dict()
-        result["vimshottari_dasha"] = dashas[:12]  # 最初の12期間
+        result["vimshottari_dasha"] = dashas
         result["current_dasha"] = current_dasha
         
         # ナクシャトラ詳細
@@ -623,20 +751,6 @@ class JyotishAPI:
         result["nakshatra_lord"] = nakshatra_info["lord_ja"]
         
         return result
-    
-    def _build_chart_map(self, grahas: List[GrahaPosition]) -> Dict[int, List[str]]:
-        """D1チャートマップを構築"""
-        chart = {i: [] for i in range(12)}
-        for g in grahas:
-            chart[g.rashi].append(jc.GRAHA_NAMES_EN[g.graha])
-        return chart
-    
-    def _build_navamsha_map(self, grahas: List[GrahaPosition]) -> Dict[int, List[str]]:
-        """D9チャートマップを構築"""
-        chart = {i: [] for i in range(12)}
-        for g in grahas:
-            chart[g.navamsha_rashi].append(jc.GRAHA_NAMES_EN[g.graha])
-        return chart
 
 
 # ============================================
@@ -0,0 +1,32 @@
+"""
+マヤ暦計算の数値カーネル
+Mayan calendar numeric kernels
+
+numbaがインストールされていれば@njit(parallel=True)でコンパイルし、
+なければ通常のPython関数として動作する（呼び出し側はNUMBA_AVAILABLEで経路を選ぶ）。
+"""
+
+import numpy as np
+
+from ...core.jit import njit, prange
+
+
+@njit(cache=True, parallel=True)
+def kin_from_ordinal(ordinals: np.ndarray, jdn_offset: int, correlation: int) -> np.ndarray:
+    """
+    先発グレゴリオ暦の序数配列から古代マヤ式KINを計算
+
+    datetime64はnumbaに渡さず、呼び出し側でint64に変換しておくこと。
+
+    Args:
+        ordinals: 序数（date.toordinal相当）のint64配列
+        jdn_offset: 序数からユリウス通日への変換定数
+        correlation: GMT相関定数
+
+    Returns:
+        KIN番号（1-260）のint64配列
+    """
+    out = np.empty(ordinals.size, dtype=np.int64)
+    for i in prange(ordinals.size):
+        out[i] = (ordinals[i] + jdn_offset - correlation) % 260 + 1
+    return out
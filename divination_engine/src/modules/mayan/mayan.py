@@ -9,13 +9,49 @@
 - GAPキン（黒キン）: 52日間のポータル日
 - 日の出切り替え: オプションで日の出時刻を考慮
 """
-from datetime import datetime, timedelta
-from typing import Dict, Tuple, Optional, Any
+import math
+from array import array
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, NamedTuple, Tuple, Optional, Any
 from enum import Enum
-from dataclasses import dataclass
 
+import numpy as np
+
+from ...core.jit import NUMBA_AVAILABLE
 from ...core.time_manager import TimeManager
 from ...models.output_schema import MayanResult
+from ._jit_kernels import kin_from_ordinal
+
+
+def _leaps_before(year: int) -> int:
+    """西暦1年からyear年までの閏年の数（グレゴリオ暦・先発）"""
+    return year // 4 - year // 100 + year // 400
+
+
+def _build_kin_table(seals, seals_en, tones, guide_offset, gap_mask) -> Tuple[Optional[tuple], ...]:
+    """
+    KIN番号（1-260）から派生項目への参照テーブルを作成
+    
+    行: (紋章, 紋章（英語）, 銀河の音, 音の名前, 音のキーワード, ウェイブスペル, ガイド, GAPキンか)
+    インデックス0は未使用（None）
+    """
+    table = [None]
+    for kin in range(1, 261):
+        seal_index = (kin - 1) % 20
+        tone = ((kin - 1) % 13) + 1
+        tone_name, tone_keyword = tones[tone]
+        table.append((
+            seals[seal_index],
+            seals_en[seal_index],
+            tone,
+            tone_name,
+            tone_keyword,
+            seals[(((kin - 1) // 13) * 13) % 20],
+            seals[(seal_index + guide_offset[(tone - 1) % 5]) % 20],
+            bool((gap_mask >> kin) & 1),
+        ))
+    return tuple(table)
 
 
 class MayanMode(Enum):
@@ -24,9 +60,8 @@ class MayanMode(Enum):
     CLASSIC = "classic"        # 古代マヤ（JDN純粋計算）
 
 
-@dataclass
-class MayanFullResult:
-    """マヤ暦の完全な計算結果"""
+class MayanFullResult(NamedTuple):
+    """マヤ暦の完全な計算結果（不変・キャッシュ共有可能）"""
     kin_number: Optional[int]           # KIN番号（フナブ・クの日はNone）
     solar_seal: Optional[str]           # 太陽の紋章
     solar_seal_en: Optional[str]        # 太陽の紋章（英語）
@@ -60,25 +95,38 @@ class MayanCalculator:
     # 考古学的・天文学的証拠に基づく最も標準的な値
     GMT_CORRELATION = 584283
     
+    # 先発グレゴリオ暦の序数（date.toordinal）からユリウス通日への変換定数
+    # JDN = toordinal() + 1721425
+    PROLEPTIC_TO_JDN_OFFSET = 1721425
+    
     # ドリームスペル基準日（1987年7月26日 = KIN 1）
     # 「ハーモニック・コンバージェンス」の開始日
     DREAMSPELL_EPOCH = datetime(1987, 7, 26)
+    DREAMSPELL_EPOCH_ORDINAL = DREAMSPELL_EPOCH.toordinal()
     
     # 20の太陽の紋章
-    SOLAR_SEALS = [
+    SOLAR_SEALS = (
         "赤い竜", "白い風", "青い夜", "黄色い種", "赤い蛇",
         "白い世界の橋渡し", "青い手", "黄色い星", "赤い月", "白い犬",
         "青い猿", "黄色い人", "赤い空歩く者", "白い魔法使い", "青い鷲",
         "黄色い戦士", "赤い地球", "白い鏡", "青い嵐", "黄色い太陽"
-    ]
+    )
     
     # 太陽の紋章の英語名
-    SOLAR_SEALS_EN = [
+    SOLAR_SEALS_EN = (
         "Red Dragon", "White Wind", "Blue Night", "Yellow Seed", "Red Serpent",
         "White World-Bridger", "Blue Hand", "Yellow Star", "Red Moon", "White Dog",
         "Blue Monkey", "Yellow Human", "Red Skywalker", "White Wizard", "Blue Eagle",
         "Yellow Warrior", "Red Earth", "White Mirror", "Blue Storm", "Yellow Sun"
-    ]
+    )
+    
+    # バッチ計算結果のインデックス配列から名前配列を一括取得するためのNumPy版
+    # 例: SOLAR_SEALS_ARR[result["seal_index"]]（フナブ・クの日の-1は別途マスクすること）
+    SOLAR_SEALS_ARR = np.array(SOLAR_SEALS)
+    SOLAR_SEALS_EN_ARR = np.array(SOLAR_SEALS_EN)
+    
+    # ガイドキンの紋章オフセット（インデックス = (銀河の音 - 1) % 5）
+    _GUIDE_OFFSET = (0, 12, 4, 16, 8)
     
     # ウェイブスペル（紋章と同じ20種）
     WAVESPELLS = SOLAR_SEALS
@@ -112,6 +160,24 @@ class MayanCalculator:
         241, 260
     }
     
+    # GAPキンのビットマスク（ビット位置 = KIN番号）
+    GAP_MASK = sum(1 << k for k in GAP_KINS)
+    
+    # バッチ計算用のビットテーブル（KIN k は _GAP_BITS[k >> 3] の第 (k & 7) ビット）
+    _GAP_BITS = np.frombuffer(GAP_MASK.to_bytes(33, "little"), dtype=np.uint8)
+    
+    # KIN番号 → 派生項目の参照テーブル（KINが決まれば以降は1回のインデックスのみ）
+    _KIN_TABLE = _build_kin_table(SOLAR_SEALS, SOLAR_SEALS_EN, GALACTIC_TONES, _GUIDE_OFFSET, GAP_MASK)
+    
+    # datetime64[D]（1970-01-01起点の日数）から先発グレゴリオ暦の序数への変換定数
+    _UNIX_EPOCH_ORDINAL = 719163
+    
+    # ドリームスペルKINの事前計算範囲（1900-01-01 〜 2100-12-31）
+    # 範囲内は序数から1回のインデックスで求まる（0 = フナブ・クの日）。範囲外は算術で計算
+    _KIN_LOOKUP_START_ORDINAL = datetime(1900, 1, 1).toordinal()
+    _KIN_LOOKUP_END_ORDINAL = datetime(2101, 1, 1).toordinal()
+    _DREAMSPELL_KIN_LOOKUP = array('H')  # モジュール読み込み時に_build_dreamspell_kin_lookupで作成
+    
     def __init__(self, mode: MayanMode = MayanMode.DREAMSPELL):
         """
         初期化
@@ -138,14 +204,29 @@ class MayanCalculator:
         Returns:
             MayanResult
         """
-        result = self.calculate_full(birth_dt, mode, sunrise_hour)
+        calc_mode = mode or self.mode
+        ordinal = self._day_ordinal(birth_dt, calc_mode, sunrise_hour)
         
+        if calc_mode == MayanMode.DREAMSPELL:
+            kin = self._dreamspell_kin(ordinal)
+            if kin == 0:
+                return MayanResult(
+                    kin_number=0,
+                    solar_seal="フナブ・クの日",
+                    wavespell="フナブ・ク（時間を超えた日）",
+                    galactic_tone=0,
+                    guide=""
+                )
+        else:
+            kin = ((ordinal + self.PROLEPTIC_TO_JDN_OFFSET - self.GMT_CORRELATION) % 260) + 1
+        
+        seal, _, tone, _, _, wavespell, guide, _ = self._KIN_TABLE[kin]
         return MayanResult(
-            kin_number=result.kin_number or 0,
-            solar_seal=result.solar_seal or "フナブ・クの日",
-            wavespell=result.wavespell,
-            galactic_tone=result.galactic_tone or 0,
-            guide=result.guide or ""
+            kin_number=kin,
+            solar_seal=seal,
+            wavespell=wavespell,
+            galactic_tone=tone,
+            guide=guide
         )
     
     def calculate_full(
@@ -166,16 +247,47 @@ class MayanCalculator:
             MayanFullResult: 完全な計算結果
         """
         calc_mode = mode or self.mode
+        ordinal = self._day_ordinal(birth_dt, calc_mode, sunrise_hour)
+        return self._calculate_full_cached(ordinal, calc_mode)
+    
+    def _day_ordinal(self, birth_dt: datetime, calc_mode: MayanMode, sunrise_hour: float) -> int:
+        """
+        計算に使う暦日の序数を求める
         
+        結果は「暦日の序数 + モード」だけで決まる
+        （古代マヤはUTCの暦日、ドリームスペルは現地の暦日）
+        """
         # 日の出切り替え: 指定時刻より前なら前日として扱う
         effective_date = birth_dt
         if birth_dt.hour < sunrise_hour:
             effective_date = birth_dt - timedelta(days=1)
         
+        if calc_mode == MayanMode.DREAMSPELL:
+            return effective_date.toordinal()
+        return self._utc_ordinal(effective_date)
+    
+    @staticmethod
+    @lru_cache(maxsize=16384)
+    def _calculate_full_cached(ordinal: int, calc_mode: MayanMode) -> MayanFullResult:
+        """
+        暦日の序数からマヤ暦を完全計算（LRUキャッシュ付き）
+        
+        クラス定数のみを参照するstaticmethodとし、キャッシュキーを(ordinal, calc_mode)に限定
+        （インスタンスをキーに含めないため全インスタンスで共有され、インスタンスも保持しない）
+        
+        Args:
+            ordinal: 暦日の序数（古代マヤはUTC、ドリームスペルは現地の日付）
+            calc_mode: 計算モード
+            
+        Returns:
+            MayanFullResult: 完全な計算結果（キャッシュで共有されるため不変）
+        """
         # === ドリームスペルモード ===
         if calc_mode == MayanMode.DREAMSPELL:
+            kin = MayanCalculator._dreamspell_kin(ordinal)
+            
             # 閏年2月29日のチェック（フナブ・クの日）
-            if effective_date.month == 2 and effective_date.day == 29:
+            if kin == 0:
                 return MayanFullResult(
                     kin_number=None,
                     solar_seal=None,
@@ -191,35 +303,18 @@ class MayanCalculator:
                     calculation_note="2月29日はフナブ・クの日です。KIN番号は付与されず、時間を超えた特別な日として扱われます。"
                 )
             
-            # ドリームスペル計算
-            kin = self._calc_kin_dreamspell(effective_date)
             note = "ドリームスペル方式で計算。閏年調整あり。"
         
         # === 古代マヤモード ===
         else:
             # JDN + GMT相関定数による計算
-            kin = self._calc_kin_classic(effective_date)
-            note = f"古代マヤ方式で計算。GMT相関定数({self.GMT_CORRELATION})使用。閏年調整なし。"
-        
-        # 太陽の紋章（KIN % 20）
-        seal_index = (kin - 1) % 20
-        solar_seal = self.SOLAR_SEALS[seal_index]
-        solar_seal_en = self.SOLAR_SEALS_EN[seal_index]
-        
-        # 銀河の音（(KIN - 1) % 13 + 1）
-        tone = ((kin - 1) % 13) + 1
-        tone_name, tone_keyword = self.GALACTIC_TONES[tone]
-        
-        # ウェイブスペル（13日周期の始まりの紋章）
-        wavespell_kin = ((kin - 1) // 13) * 13 + 1
-        wavespell_index = (wavespell_kin - 1) % 20
-        wavespell = self.WAVESPELLS[wavespell_index]
-        
-        # ガイドキン
-        guide = self._calc_guide(kin, tone, seal_index)
+            jdn = ordinal + MayanCalculator.PROLEPTIC_TO_JDN_OFFSET
+            kin = ((jdn - MayanCalculator.GMT_CORRELATION) % 260) + 1
+            note = f"古代マヤ方式で計算。GMT相関定数({MayanCalculator.GMT_CORRELATION})使用。閏年調整なし。"
         
-        # GAPキン判定
-        is_gap = kin in self.GAP_KINS
+        # 紋章・銀河の音・ウェイブスペル・ガイド・GAPキンはKINの純関数なので参照テーブルから取得
+        (solar_seal, solar_seal_en, tone, tone_name, tone_keyword,
+         wavespell, guide, is_gap) = MayanCalculator._KIN_TABLE[kin]
         
         return MayanFullResult(
             kin_number=kin,
@@ -236,27 +331,115 @@ class MayanCalculator:
             calculation_note=note
         )
     
-    def _calc_kin_classic(self, dt: datetime) -> int:
+    def calculate_batch(
+        self,
+        dates: Any,
+        mode: Optional[MayanMode] = None
+    ) -> Dict[str, np.ndarray]:
         """
-        古代マヤ式KIN計算
+        複数の日付をまとめて計算（NumPyによるベクトル化）
         
-        JDN（ユリウス通日）とGMT相関定数を使用した厳密計算
-        閏年は考慮せず、純粋な日数カウント
+        日付は暦日として扱い、日の出切り替えやタイムゾーン変換は行わない
+        （古代マヤモードではUTCの暦日として扱う）。
         
-        計算式: KIN = (JDN - GMT_CORRELATION) mod 260 + 1
+        Args:
+            dates: 日付の配列（datetime64[D]に変換可能なもの）
+            mode: 計算モード（省略時はインスタンスのモード）
+            
+        Returns:
+            配列の辞書:
+                kin: KIN番号（フナブ・クの日は0）
+                seal_index: 太陽の紋章インデックス（フナブ・クの日は-1）
+                tone: 銀河の音（フナブ・クの日は0）
+                wavespell_index: ウェイブスペルの紋章インデックス（フナブ・クの日は-1）
+                is_gap_kin: GAPキンかどうか
+                is_hunab_ku: フナブ・クの日かどうか
         """
-        # ユリウス日を計算
-        jd = TimeManager.to_julian_day(dt)
+        calc_mode = mode or self.mode
+        days = np.asarray(dates, dtype='datetime64[D]')
+        ordinals = days.astype(np.int64) + self._UNIX_EPOCH_ORDINAL
+        
+        if calc_mode == MayanMode.DREAMSPELL:
+            years = days.astype('datetime64[Y]').astype(np.int64) + 1970
+            months = days.astype('datetime64[M]').astype(np.int64) % 12 + 1
+            month_days = (days - days.astype('datetime64[M]')).astype(np.int64) + 1
+            is_hunab_ku = (months == 2) & (month_days == 29)
+            
+            # 基準日以降の閏年2月29日の数（_count_leap_daysと同じ規則）
+            epoch_year = self.DREAMSPELL_EPOCH.year
+            is_leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+            leap_days = (
+                _leaps_before(years - 1) - _leaps_before(epoch_year)
+                + (is_leap & (months > 2))
+            )
+            leap_days = np.where(years > epoch_year, leap_days, 0)
+            
+            adjusted_days = ordinals - self.DREAMSPELL_EPOCH_ORDINAL - leap_days
+            kin = adjusted_days % 260 + 1
+        else:
+            if NUMBA_AVAILABLE:
+                kin = kin_from_ordinal(
+                    ordinals.ravel(), self.PROLEPTIC_TO_JDN_OFFSET, self.GMT_CORRELATION
+                ).reshape(ordinals.shape)
+            else:
+                jdn = ordinals + self.PROLEPTIC_TO_JDN_OFFSET
+                kin = (jdn - self.GMT_CORRELATION) % 260 + 1
+            is_hunab_ku = np.zeros(kin.shape, dtype=bool)
         
-        # JDを整数に（ユリウス通日）
-        jdn = int(jd + 0.5)
+        seal_index = (kin - 1) % 20
+        tone = (kin - 1) % 13 + 1
+        wavespell_index = ((kin - 1) // 13 * 13) % 20
+        is_gap = ((self._GAP_BITS[kin >> 3] >> (kin & 7)) & 1).astype(bool)
         
-        # KIN計算
-        kin = ((jdn - self.GMT_CORRELATION) % 260) + 1
+        if is_hunab_ku.any():
+            kin = np.where(is_hunab_ku, 0, kin)
+            seal_index = np.where(is_hunab_ku, -1, seal_index)
+            tone = np.where(is_hunab_ku, 0, tone)
+            wavespell_index = np.where(is_hunab_ku, -1, wavespell_index)
+            is_gap = is_gap & ~is_hunab_ku
         
-        return kin
+        return {
+            "kin": kin,
+            "seal_index": seal_index,
+            "tone": tone,
+            "wavespell_index": wavespell_index,
+            "is_gap_kin": is_gap,
+            "is_hunab_ku": is_hunab_ku
+        }
+    
+    @staticmethod
+    def _utc_ordinal(dt: datetime) -> int:
+        """
+        UTCでの暦日の序数を取得
+        
+        タイムゾーンなしの日時はTimeManagerの規約通りJSTとして扱う
+        """
+        if dt.tzinfo is not timezone.utc:
+            dt = TimeManager.to_utc(dt)
+        return dt.toordinal()
+    
+    @classmethod
+    def cache_info(cls):
+        """calculate_fullのキャッシュ統計（監視用）"""
+        return cls._calculate_full_cached.cache_info()
     
-    def _calc_kin_dreamspell(self, dt: datetime) -> int:
+    @classmethod
+    def _dreamspell_kin(cls, ordinal: int) -> int:
+        """
+        暦日の序数からドリームスペル式KINを取得（フナブ・クの日は0）
+        
+        1900〜2100年は事前計算テーブルを参照し、範囲外のみ算術で計算する
+        """
+        if cls._KIN_LOOKUP_START_ORDINAL <= ordinal < cls._KIN_LOOKUP_END_ORDINAL:
+            return cls._DREAMSPELL_KIN_LOOKUP[ordinal - cls._KIN_LOOKUP_START_ORDINAL]
+        
+        dt = datetime.fromordinal(ordinal)
+        if dt.month == 2 and dt.day == 29:
+            return 0
+        return cls._calc_kin_dreamspell(dt)
+    
+    @classmethod
+    def _calc_kin_dreamspell(cls, dt: datetime) -> int:
         """
         ドリームスペル式KIN計算
         
@@ -264,10 +447,10 @@ class MayanCalculator:
         閏年2月29日はスキップ（フナブ・クの日として別処理）
         """
         # 基準日からの日数を計算
-        days_diff = (dt.date() - self.DREAMSPELL_EPOCH.date()).days
+        days_diff = dt.toordinal() - cls.DREAMSPELL_EPOCH_ORDINAL
         
         # 閏年2月29日の数を引く（スキップされた日数）
-        leap_days = self._count_leap_days(self.DREAMSPELL_EPOCH, dt)
+        leap_days = cls._count_leap_days(cls.DREAMSPELL_EPOCH, dt)
         adjusted_days = days_diff - leap_days
         
         # KIN計算（1から260の循環）
@@ -277,54 +460,56 @@ class MayanCalculator:
         
         return kin
     
-    def _count_leap_days(self, start: datetime, end: datetime) -> int:
+    @classmethod
+    def _count_leap_days(cls, start: datetime, end: datetime) -> int:
         """
-        期間内の閏年2月29日の数をカウント
+        期間内の閏年2月29日の数をカウント（start <= 2月29日 < end）
+        
+        両端の年だけ個別に判定し、間の年は閏年数の差分でO(1)で求める
         """
-        count = 0
         # タイムゾーンの有無を統一して比較
         start_naive = start.replace(tzinfo=None)
         end_naive = end.replace(tzinfo=None)
-        year = start_naive.year
+        start_year = start_naive.year
+        end_year = end_naive.year
+        
+        if end_year < start_year:
+            return 0
         
-        while year <= end_naive.year:
-            # 閏年かどうか
-            if self._is_leap_year(year):
-                leap_day = datetime(year, 2, 29)
-                if start_naive <= leap_day < end_naive:
-                    count += 1
-            year += 1
+        count = 0
+        # 開始年
+        if cls._is_leap_year(start_year):
+            leap_day = datetime(start_year, 2, 29)
+            if start_naive <= leap_day < end_naive:
+                count += 1
+        
+        if end_year > start_year:
+            # 間の年（start_year < year < end_year）
+            count += _leaps_before(end_year - 1) - _leaps_before(start_year)
+            # 終了年
+            if cls._is_leap_year(end_year) and datetime(end_year, 2, 29) < end_naive:
+                count += 1
         
         return count
     
-    def _is_leap_year(self, year: int) -> bool:
-        """閏年判定"""
-        return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
-    
-    def _calc_kin(self, jd: float) -> int:
+    @staticmethod
+    def _is_leap_year(year: int) -> bool:
         """
-        ユリウス日からKIN番号を計算（下位互換性のため維持）
+        閏年判定
+        
+        4の倍数かつ「25の倍数でない、または16の倍数」
+        （4の倍数の中では 100の倍数 ⇔ 25の倍数、400の倍数 ⇔ 16の倍数）
         """
-        return self._calc_kin_classic(datetime.now())
+        return not (year & 3) and (year % 25 != 0 or not (year & 15))
     
-    def _calc_guide(self, kin: int, tone: int, seal_index: int) -> str:
-        """
-        ガイドキンを計算
-        銀河の音によって決まる
+    def _calc_kin(self, jd: float) -> int:
         """
-        # 音ごとのガイド計算オフセット
-        guide_offsets = {
-            1: 0, 6: 0, 11: 0,      # 同じ紋章
-            2: 12, 7: 12, 12: 12,   # +12（実質-8）
-            3: 4, 8: 4, 13: 4,      # +4
-            4: 16, 9: 16,           # +16（実質-4）
-            5: 8, 10: 8             # +8
-        }
-        
-        offset = guide_offsets.get(tone, 0)
-        guide_index = (seal_index + offset) % 20
+        ユリウス日からKIN番号を計算（古代マヤ式・下位互換性のため維持）
         
-        return self.SOLAR_SEALS[guide_index]
+        ユリウス日（正午起点）の暦日に対応するユリウス通日から直接求める
+        """
+        jdn = math.floor(jd + 0.5)
+        return ((jdn - self.GMT_CORRELATION) % 260) + 1
     
     def get_tone_info(self, tone: int) -> Tuple[str, str]:
         """銀河の音の詳細情報を取得"""
@@ -355,7 +540,9 @@ class MayanCalculator:
     
     def is_gap_kin(self, kin: int) -> bool:
         """指定KINがGAPキン（黒キン）かどうか判定"""
-        return kin in self.GAP_KINS
+        if not 1 <= kin <= 260:
+            return False
+        return bool((self.GAP_MASK >> kin) & 1)
     
     def get_all_gap_kins(self) -> list:
         """すべてのGAPキンを取得"""
@@ -396,3 +583,14 @@ class MayanCalculator:
             "note": "古代マヤとドリームスペルでは閏年の扱いが異なるため、KIN番号にズレが生じます。"
         }
 
+
+
+def _build_dreamspell_kin_lookup() -> array:
+    """1900〜2100年のドリームスペルKINをcalculate_batchで一括計算（フナブ・クの日は0）"""
+    start = np.datetime64('1970-01-01') + (MayanCalculator._KIN_LOOKUP_START_ORDINAL - MayanCalculator._UNIX_EPOCH_ORDINAL)
+    n_days = MayanCalculator._KIN_LOOKUP_END_ORDINAL - MayanCalculator._KIN_LOOKUP_START_ORDINAL
+    kins = MayanCalculator().calculate_batch(np.arange(start, start + n_days), MayanMode.DREAMSPELL)["kin"]
+    return array('H', kins.astype(np.uint16).tobytes())
+
+
+MayanCalculator._DREAMSPELL_KIN_LOOKUP = _build_dreamspell_kin_lookup()
@@ -0,0 +1,55 @@
+"""
+姓名判断の数値カーネル
+Name analysis numeric kernels
+
+numbaがインストールされていれば@njit(parallel=True)でコンパイルし、
+なければ通常のPython関数として動作する（呼び出し側はNUMBA_AVAILABLEで経路を選ぶ）。
+"""
+
+import numpy as np
+
+from ...core.jit import njit, prange
+
+
+@njit(cache=True, parallel=True)
+def five_grids(strokes: np.ndarray, offsets: np.ndarray, family_len: np.ndarray) -> np.ndarray:
+    """
+    連結した画数配列から各姓名の五格を計算
+
+    Args:
+        strokes: 全姓名の文字画数を連結した配列
+        offsets: 各姓名の開始位置（長さN+1、末尾は全体の長さ）
+        family_len: 各姓名の姓の文字数
+
+    Returns:
+        (N, 5) のint64配列（天格, 人格, 地格, 外格, 総格）
+    """
+    n = family_len.size
+    out = np.empty((n, 5), dtype=np.int64)
+    for i in prange(n):
+        start = offsets[i]
+        split = start + family_len[i]
+        end = offsets[i + 1]
+
+        family_sum = 0
+        for j in range(start, split):
+            family_sum += strokes[j]
+        given_sum = 0
+        for j in range(split, end):
+            given_sum += strokes[j]
+
+        # 一文字姓・名は霊数1を加算
+        tenkaku = family_sum + (1 if split - start == 1 else 0)
+        chikaku = given_sum + (1 if end - split == 1 else 0)
+        jinkaku = strokes[split - 1] + strokes[split]
+        soukaku = family_sum + given_sum
+        gaikaku = soukaku - jinkaku
+        if gaikaku <= 0:
+            gaikaku = 1
+
+        out[i, 0] = tenkaku
+        out[i, 1] = jinkaku
+        out[i, 2] = chikaku
+        out[i, 3] = gaikaku
+        out[i, 4] = soukaku
+    return out
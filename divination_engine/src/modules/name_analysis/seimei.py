@@ -2,11 +2,38 @@
 姓名判断モジュール
 五格（天格・人格・地格・外格・総格）の計算
 """
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 import json
 import os
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ...core.jit import NUMBA_AVAILABLE
 from ...models.output_schema import SeimeiResult
+from ._jit_kernels import five_grids
+
+
+# 画数の吉凶（簡易版）
+LUCKY_NUMBERS = frozenset({1, 3, 5, 6, 7, 8, 11, 13, 15, 16, 17, 18, 21, 23, 24, 25, 29, 31, 32, 33, 35, 37, 38, 39, 41, 45, 47, 48})
+UNLUCKY_NUMBERS = frozenset({2, 4, 9, 10, 12, 14, 19, 20, 22, 26, 27, 28, 34, 36, 40, 42, 43, 44, 46, 49, 50})
+
+# 吉凶ルックアップテーブル（インデックス = 画数、値 = _FORTUNES のインデックス）
+_FORTUNES = ("中", "吉", "凶")
+_FORTUNE_LUT = bytearray(128)
+for _n in LUCKY_NUMBERS:
+    _FORTUNE_LUT[_n] = 1
+for _n in UNLUCKY_NUMBERS:
+    _FORTUNE_LUT[_n] = 2
+_FORTUNE_LUT = bytes(_FORTUNE_LUT)
+del _n
+
+# 五行の循環（(画数 - 1) % 5 で参照）
+_ELEMENT_CYCLE = ("木", "火", "土", "金", "水")
 
 
 class SeimeiCalculator:
@@ -32,28 +59,42 @@ class SeimeiCalculator:
         
         # よく使われる漢字
         "一": 1, "二": 2, "三": 3, "四": 5, "五": 4, "六": 4, "七": 2, "八": 2, "九": 2, "十": 2,
-        "山": 3, "川": 3, "田": 5, "木": 4, "水": 4, "火": 4, "土": 3, "金": 8, "日": 4, "月": 4,
+        "山": 3, "川": 3, "田": 5, "木": 4, "水": 4, "火": 4, "土": 3, "金": 8, "日": 4,
         "人": 2, "口": 3, "目": 5, "手": 4, "足": 7, "心": 4, "言": 7, "糸": 6,
         
         # 名前に頻出する漢字
         "安": 6, "瀬": 19, "諒": 15, "理": 11, "明": 8, "美": 9, "子": 3, "太": 4, "郎": 14,
         "大": 3, "小": 3, "中": 4, "上": 3, "下": 3, "本": 5, "正": 5,
-        "佐": 7, "藤": 21, "田": 5, "中": 4, "村": 7, "井": 4, "高": 10, "橋": 16,
-        "健": 11, "一": 1, "二": 2, "男": 7, "女": 3, "介": 4, "也": 3, "雄": 12,
+        "佐": 7, "藤": 21, "村": 7, "井": 4, "高": 10, "橋": 16,
+        "健": 11, "男": 7, "女": 3, "介": 4, "也": 3, "雄": 12,
         "和": 8, "幸": 8, "彦": 9, "恵": 12, "真": 10, "直": 8, "俊": 9, "浩": 11
     }
     
+    # 画数テーブル（コードポイント直引き）の範囲: BMP + CJK拡張B〜F（U+0000〜U+2FFFF）
+    # 範囲外の文字は末尾の番兵要素（既定値10画）を参照する
+    STROKE_TABLE_SIZE = 0x30000
+    
     def __init__(self, strokes_file: Optional[str] = None):
         """
         Args:
             strokes_file: 画数データJSONファイルのパス
         """
-        self.strokes = self.DEFAULT_STROKES.copy()
-        
+        external_strokes = {}
         if strokes_file and os.path.exists(strokes_file):
-            with open(strokes_file, 'r', encoding='utf-8') as f:
-                external_strokes = json.load(f)
-                self.strokes.update(external_strokes)
+            external_strokes = self._load_strokes_file(strokes_file)
+        
+        # 既定値と外部データを一度だけ結合（外部データが優先）
+        self.strokes = {**self.DEFAULT_STROKES, **external_strokes}
+        self._stroke_table: Optional[np.ndarray] = None
+    
+    @staticmethod
+    def _load_strokes_file(strokes_file: str) -> Dict[str, int]:
+        """画数データJSONを読み込む（orjsonがあれば使用）"""
+        if orjson is not None:
+            with open(strokes_file, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(strokes_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
     
     def calculate(self, family_name: str, given_name: str) -> SeimeiResult:
         """
@@ -122,22 +163,77 @@ class SeimeiCalculator:
         # 本番では外部データベースを参照
         return 10  # デフォルト値
     
+    def _get_stroke_table(self) -> np.ndarray:
+        """
+        コードポイント → 画数の直引きテーブルを取得（初回のみ作成）
+        
+        辞書にない文字・範囲外の文字は_get_strokeと同じ既定値10画
+        """
+        if self._stroke_table is None:
+            table = np.full(self.STROKE_TABLE_SIZE + 1, 10, dtype=np.uint8)
+            for char, stroke in self.strokes.items():
+                if len(char) == 1 and ord(char) < self.STROKE_TABLE_SIZE:
+                    table[ord(char)] = stroke
+            self._stroke_table = table
+        return self._stroke_table
+    
+    def calculate_batch(self, names: Iterable[Tuple[str, str]]) -> Dict[str, np.ndarray]:
+        """
+        複数の姓名の五格をまとめて計算（候補名の一括検索用）
+        
+        全文字をUTF-32のコードポイント配列に変換し、画数テーブルを一括参照する。
+        
+        Args:
+            names: (姓, 名) のタプルの列（いずれも1文字以上）
+            
+        Returns:
+            配列の辞書: tenkaku, jinkaku, chikaku, gaikaku, soukaku
+        """
+        names = list(names)
+        family_len = np.fromiter((len(f) for f, _ in names), dtype=np.int64, count=len(names))
+        given_len = np.fromiter((len(g) for _, g in names), dtype=np.int64, count=len(names))
+        if (family_len == 0).any() or (given_len == 0).any():
+            raise ValueError("姓・名は1文字以上である必要があります")
+        
+        text = "".join(f + g for f, g in names)
+        codepoints = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        strokes = self._get_stroke_table()[np.minimum(codepoints, self.STROKE_TABLE_SIZE)].astype(np.int64)
+        
+        offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(family_len + given_len, out=offsets[1:])
+        
+        if NUMBA_AVAILABLE:
+            grids = five_grids(strokes, offsets, family_len)
+            tenkaku, jinkaku, chikaku, gaikaku, soukaku = grids.T
+        else:
+            split = offsets[:-1] + family_len
+            cumulative = np.zeros(strokes.size + 1, dtype=np.int64)
+            np.cumsum(strokes, out=cumulative[1:])
+            family_sum = cumulative[split] - cumulative[offsets[:-1]]
+            given_sum = cumulative[offsets[1:]] - cumulative[split]
+            
+            # 一文字姓・名は霊数1を加算
+            tenkaku = family_sum + (family_len == 1)
+            chikaku = given_sum + (given_len == 1)
+            jinkaku = strokes[split - 1] + strokes[split]
+            soukaku = family_sum + given_sum
+            gaikaku = np.maximum(soukaku - jinkaku, 1)
+        
+        return {
+            "tenkaku": tenkaku,
+            "jinkaku": jinkaku,
+            "chikaku": chikaku,
+            "gaikaku": gaikaku,
+            "soukaku": soukaku
+        }
+    
     def get_number_meaning(self, number: int) -> Dict:
         """画数の意味を取得"""
         # 吉凶判定（簡易版）
-        LUCKY_NUMBERS = {1, 3, 5, 6, 7, 8, 11, 13, 15, 16, 17, 18, 21, 23, 24, 25, 29, 31, 32, 33, 35, 37, 38, 39, 41, 45, 47, 48}
-        UNLUCKY_NUMBERS = {2, 4, 9, 10, 12, 14, 19, 20, 22, 26, 27, 28, 34, 36, 40, 42, 43, 44, 46, 49, 50}
-        
-        if number in LUCKY_NUMBERS:
-            fortune = "吉"
-        elif number in UNLUCKY_NUMBERS:
-            fortune = "凶"
-        else:
-            fortune = "中"
+        fortune = _FORTUNES[_FORTUNE_LUT[number]] if 0 <= number < len(_FORTUNE_LUT) else "中"
         
         # 五行
-        element_cycle = ["木", "火", "土", "金", "水"]
-        element = element_cycle[(number - 1) % 5] if number > 0 else "水"
+        element = _ELEMENT_CYCLE[(number - 1) % 5] if number > 0 else "水"
         
         return {
             "number": number,
@@ -2,7 +2,24 @@
 姓名判断（熊崎式）ロジッククラス
 厳密なアルゴリズム実装
 """
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+
+def _build_relation_lut(sheng: Tuple[int, ...], ke: Tuple[int, ...]) -> Tuple[str, ...]:
+    """五行関係の25要素テーブルを構築（インデックス = 前の五行 * 5 + 後の五行）"""
+    lut = []
+    for e1 in range(5):
+        for e2 in range(5):
+            if e1 == e2:
+                lut.append("比和")
+            elif sheng[e1] == e2:
+                lut.append("相生")
+            elif ke[e1] == e2:
+                lut.append("相剋")
+            else:
+                # 上記以外の組み合わせも相剋と見なす
+                lut.append("相剋")
+    return tuple(lut)
 
 
 class SeimeiLogic:
@@ -16,33 +33,35 @@ class SeimeiLogic:
     # 霊数（仮想数）
     GHOST_NUMBER: int = 1
     
-    # 五行（五元素）の判定テーブル
-    FIVE_ELEMENTS_TABLE: Dict[int, str] = {
-        1: "木", 2: "木",
-        3: "火", 4: "火",
-        5: "土", 6: "土",
-        7: "金", 8: "金",
-        9: "水", 0: "水"
-    }
+    # 五行（木・火・土・金・水 = 0〜4）
+    ELEMENTS: Tuple[str, ...] = ("木", "火", "土", "金", "水")
+    ELEMENT_INDEX: Dict[str, int] = {e: i for i, e in enumerate(ELEMENTS)}
     
-    # 五行の相生・相剋関係
+    # 五行（五元素）の判定テーブル（インデックス = 1の位の数字）
+    FIVE_ELEMENTS_TABLE: Tuple[str, ...] = (
+        "水",        # 0
+        "木", "木",  # 1, 2
+        "火", "火",  # 3, 4
+        "土", "土",  # 5, 6
+        "金", "金",  # 7, 8
+        "水",        # 9
+    )
+    
+    # 五行の相生・相剋関係（インデックス = 五行番号、値 = 相手の五行番号）
     # 相生（生み出す関係）: 木→火→土→金→水→木
-    SHENG_CYCLE: Dict[str, str] = {
-        "木": "火",
-        "火": "土",
-        "土": "金",
-        "金": "水",
-        "水": "木"
-    }
+    SHENG_CYCLE: Tuple[int, ...] = (1, 2, 3, 4, 0)
     
     # 相剋（抑制する関係）: 木→土、土→水、水→火、火→金、金→木
-    KE_CYCLE: Dict[str, str] = {
-        "木": "土",
-        "土": "水",
-        "水": "火",
-        "火": "金",
-        "金": "木"
-    }
+    KE_CYCLE: Tuple[int, ...] = (2, 3, 4, 0, 1)
+    
+    # 1の位の数字 → 五行番号
+    _DIGIT_ELEMENT_INDEX: Tuple[int, ...] = (4, 0, 0, 1, 1, 2, 2, 3, 3, 4)
+    
+    # 五行関係テーブル（インデックス = 前の五行番号 * 5 + 後の五行番号）
+    _RELATION_LUT: Tuple[str, ...] = _build_relation_lut(SHENG_CYCLE, KE_CYCLE)
+    
+    # 陰陽配列の変換テーブル（奇数=1→○（陽）、偶数=0→●（陰））
+    _YY_TABLE = str.maketrans("01", "●○")
     
     def __init__(self, stroke_dict: Dict[str, int]):
         """
@@ -84,8 +103,11 @@ class SeimeiLogic:
         Raises:
             ValueError: 辞書にない文字が含まれている場合
         """
-        self.validate_name(text)
-        return [self.stroke_dict[char] for char in text]
+        # 検証と変換を1回の走査で行う
+        try:
+            return [self.stroke_dict[char] for char in text]
+        except KeyError as e:
+            raise ValueError(f"画数辞書に文字 '{e.args[0]}' が見つかりません") from None
     
     def calc_five_elements(self, surname: str, firstname: str) -> Dict:
         """
@@ -105,22 +127,35 @@ class SeimeiLogic:
         Returns:
             五格の辞書
         """
-        # 画数リストを取得
-        S_list = self.calculate_strokes(surname)
-        N_list = self.calculate_strokes(firstname)
-        
+        return self._calc_five_grids(
+            self.calculate_strokes(surname),
+            self.calculate_strokes(firstname)
+        )
+    
+    def _calc_five_grids(
+        self,
+        S_list: List[int],
+        N_list: List[int],
+        s_sum: Optional[int] = None,
+        n_sum: Optional[int] = None
+    ) -> Dict:
+        """画数リスト（と計算済みの合計）から五格を計算（calc_five_elementsの本体）"""
         s_len = len(S_list)
         n_len = len(N_list)
+        if s_sum is None:
+            s_sum = sum(S_list)
+        if n_sum is None:
+            n_sum = sum(N_list)
         
         # A. 天格 (Ten-kaku)
         if s_len >= 2:
-            ten_kaku = sum(S_list)
+            ten_kaku = s_sum
         else:  # s_len == 1
             ten_kaku = S_list[0] + self.GHOST_NUMBER
         
         # B. 地格 (Chi-kaku)
         if n_len >= 2:
-            chi_kaku = sum(N_list)
+            chi_kaku = n_sum
         else:  # n_len == 1
             chi_kaku = N_list[0] + self.GHOST_NUMBER
         
@@ -144,7 +179,7 @@ class SeimeiLogic:
         
         # E. 総格 (Sou-kaku)
         # 純粋な合計画数（霊数は加算しない）
-        sou_kaku = sum(S_list) + sum(N_list)
+        sou_kaku = s_sum + n_sum
         
         return {
             "ten_kaku": ten_kaku,
@@ -167,8 +202,7 @@ class SeimeiLogic:
         Returns:
             五行（"木"/"火"/"土"/"金"/"水"）
         """
-        last_digit = number % 10
-        return self.FIVE_ELEMENTS_TABLE[last_digit]
+        return self.FIVE_ELEMENTS_TABLE[number % 10]
     
     def judge_relation(self, element1: str, element2: str) -> str:
         """
@@ -181,15 +215,13 @@ class SeimeiLogic:
         Returns:
             関係性（"相生"/"相剋"/"比和"）
         """
-        if element1 == element2:
-            return "比和"
-        elif self.SHENG_CYCLE.get(element1) == element2:
-            return "相生"
-        elif self.KE_CYCLE.get(element1) == element2:
-            return "相剋"
-        else:
-            # 上記以外の組み合わせも相剋と見なす
-            return "相剋"
+        try:
+            return self._RELATION_LUT[
+                self.ELEMENT_INDEX[element1] * 5 + self.ELEMENT_INDEX[element2]
+            ]
+        except KeyError:
+            # 五行以外の値: 同一なら比和、それ以外は相剋と見なす
+            return "比和" if element1 == element2 else "相剋"
     
     def get_san_sai(self, ten_kaku: int, jin_kaku: int, chi_kaku: int) -> Dict:
         """
@@ -203,21 +235,22 @@ class SeimeiLogic:
         Returns:
             三才配置の辞書（五行と吉凶関係）
         """
-        # 各格の五行を取得
-        ten_element = self.get_element(ten_kaku)
-        jin_element = self.get_element(jin_kaku)
-        chi_element = self.get_element(chi_kaku)
+        # 各格の五行番号を取得（文字列化は出力時のみ）
+        digit_element = self._DIGIT_ELEMENT_INDEX
+        ten_element = digit_element[ten_kaku % 10]
+        jin_element = digit_element[jin_kaku % 10]
+        chi_element = digit_element[chi_kaku % 10]
         
         # 成功運: 天格→人格の関係
-        success_luck = self.judge_relation(ten_element, jin_element)
+        success_luck = self._RELATION_LUT[ten_element * 5 + jin_element]
         
         # 基礎運: 人格→地格の関係
-        foundation_luck = self.judge_relation(jin_element, chi_element)
+        foundation_luck = self._RELATION_LUT[jin_element * 5 + chi_element]
         
         return {
-            "ten_element": ten_element,
-            "jin_element": jin_element,
-            "chi_element": chi_element,
+            "ten_element": self.ELEMENTS[ten_element],
+            "jin_element": self.ELEMENTS[jin_element],
+            "chi_element": self.ELEMENTS[chi_element],
             "success_luck": success_luck,
             "foundation_luck": foundation_luck
         }
@@ -237,14 +270,59 @@ class SeimeiLogic:
         """
         all_strokes = surname_strokes + firstname_strokes
         
-        yin_yang_str = ""
-        for stroke in all_strokes:
-            if stroke % 2 == 1:
-                yin_yang_str += "○"  # 奇数（陽）
-            else:
-                yin_yang_str += "●"  # 偶数（陰）
+        # 各画数の奇偶を1ビットずつ整数に詰め、最後に一度だけ文字列化する
+        bits = 0
+        for i, stroke in enumerate(all_strokes):
+            bits |= (stroke & 1) << i
+        
+        return self._format_yin_yang(bits, len(all_strokes))
+    
+    def _format_yin_yang(self, bits: int, length: int) -> str:
+        """奇偶ビット列（下位ビットが先頭の文字）を陰陽配列文字列に変換"""
+        if not length:
+            return ""
+        return format(bits, f"0{length}b")[::-1].translate(self._YY_TABLE)
+    
+    def _compute_all(self, surname: str, firstname: str) -> Tuple[List[int], List[int], Dict, str]:
+        """
+        姓・名をそれぞれ1回だけ走査し、画数リスト・五格・陰陽配列をまとめて計算
+        
+        Returns:
+            (姓の画数リスト, 名の画数リスト, 五格の辞書, 陰陽配列文字列)
+            
+        Raises:
+            ValueError: 辞書にない文字が含まれている場合
+        """
+        stroke_dict = self.stroke_dict
+        bits = 0
+        i = 0
         
-        return yin_yang_str
+        surname_strokes = []
+        s_sum = 0
+        for char in surname:
+            stroke = stroke_dict.get(char)
+            if stroke is None:
+                raise ValueError(f"画数辞書に文字 '{char}' が見つかりません")
+            surname_strokes.append(stroke)
+            s_sum += stroke
+            bits |= (stroke & 1) << i
+            i += 1
+        
+        firstname_strokes = []
+        n_sum = 0
+        for char in firstname:
+            stroke = stroke_dict.get(char)
+            if stroke is None:
+                raise ValueError(f"画数辞書に文字 '{char}' が見つかりません")
+            firstname_strokes.append(stroke)
+            n_sum += stroke
+            bits |= (stroke & 1) << i
+            i += 1
+        
+        five_grids = self._calc_five_grids(surname_strokes, firstname_strokes, s_sum, n_sum)
+        yin_yang = self._format_yin_yang(bits, i)
+        
+        return surname_strokes, firstname_strokes, five_grids, yin_yang
     
     def analyze(self, surname: str, firstname: str) -> Dict:
         """
@@ -257,12 +335,10 @@ class SeimeiLogic:
         Returns:
             JSON互換の分析結果辞書
         """
-        # 画数リストを取得
-        surname_strokes = self.calculate_strokes(surname)
-        firstname_strokes = self.calculate_strokes(firstname)
-        
-        # 五格を計算
-        five_grids = self.calc_five_elements(surname, firstname)
+        # 画数リスト・五格・陰陽配列を一括計算
+        surname_strokes, firstname_strokes, five_grids, yin_yang = self._compute_all(
+            surname, firstname
+        )
         
         # 三才配置を判定
         san_sai = self.get_san_sai(
@@ -271,9 +347,6 @@ class SeimeiLogic:
             five_grids["chi_kaku"]
         )
         
-        # 陰陽配列を判定
-        yin_yang = self.get_yin_yang(surname_strokes, firstname_strokes)
-        
         return {
             "surface": {
                 "surname": surname,
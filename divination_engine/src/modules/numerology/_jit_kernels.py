@@ -0,0 +1,104 @@
+"""
+数秘術の数値カーネル
+Numerology numeric kernels
+
+桁和による数値還元を整数演算だけで行う関数群。
+numbaがインストールされていれば@njitでコンパイルし、なければ通常のPython関数として動作する。
+"""
+
+import numpy as np
+
+from ...core.jit import njit
+
+
+@njit(cache=True)
+def reduce_digits(n: int, master_numbers: tuple, keep_master: bool) -> int:
+    """
+    桁和を繰り返して1桁に還元（keep_masterならマスターナンバーで止める）
+
+    Args:
+        n: 還元する数値
+        master_numbers: マスターナンバーのタプル
+        keep_master: マスターナンバーを保持するか
+
+    Returns:
+        還元された数値
+    """
+    while n > 9:
+        if keep_master and n in master_numbers:
+            return n
+        s = 0
+        while n:
+            s += n % 10
+            n //= 10
+        n = s
+    return n
+
+
+@njit(cache=True)
+def reduce_table(size: int, master_numbers: tuple, keep_master: bool) -> np.ndarray:
+    """0〜size-1の還元結果を一括計算（事前計算テーブル用）"""
+    out = np.empty(size, dtype=np.int64)
+    for n in range(size):
+        out[n] = reduce_digits(n, master_numbers, keep_master)
+    return out
+
+
+@njit(cache=True)
+def single_digit_table(size: int, keep_number: int) -> np.ndarray:
+    """
+    0〜size-1をカバラ式に還元した結果を一括計算（事前計算テーブル用）
+
+    keep_numberはそのまま保持し、0以下は1とする
+    """
+    out = np.empty(size, dtype=np.int64)
+    for n in range(size):
+        if n == keep_number:
+            out[n] = n
+            continue
+        m = n
+        while m > 9:
+            s = 0
+            while m:
+                s += m % 10
+                m //= 10
+            m = s
+        out[n] = m if m > 0 else 1
+    return out
+
+
+@njit(cache=True)
+def cycle_numbers(months: np.ndarray, days: np.ndarray, years: np.ndarray) -> np.ndarray:
+    """
+    複数の生年月日のピナクル・チャレンジを一括計算
+
+    ピナクル・チャレンジはマスターナンバーを保持しない還元のみを使う。
+
+    Returns:
+        (n, 9)の配列: ピナクル1-4, チャレンジ1-4, 第1ピナクルの終了年齢
+    """
+    no_master = (0,)
+    n = months.shape[0]
+    out = np.empty((n, 9), dtype=np.int64)
+    for i in range(n):
+        month_r = reduce_digits(months[i], no_master, False)
+        day_r = reduce_digits(days[i], no_master, False)
+        year_r = reduce_digits(years[i], no_master, False)
+
+        p1 = reduce_digits(month_r + day_r, no_master, False)
+        p2 = reduce_digits(day_r + year_r, no_master, False)
+        out[i, 0] = p1
+        out[i, 1] = p2
+        out[i, 2] = reduce_digits(p1 + p2, no_master, False)
+        out[i, 3] = reduce_digits(month_r + year_r, no_master, False)
+
+        c1 = abs(month_r - day_r)
+        c2 = abs(day_r - year_r)
+        out[i, 4] = c1
+        out[i, 5] = c2
+        out[i, 6] = abs(c1 - c2)
+        out[i, 7] = abs(month_r - year_r)
+
+        # ライフパス（基数）に応じた第1ピナクルの終了年齢
+        out[i, 8] = 36 - reduce_digits(month_r + day_r + year_r, no_master, False)
+    return out
@@ -0,0 +1,24 @@
+"""
+Windows環境でのUTF-8出力対応
+importでは標準出力を変更しない。CLIのエントリーポイント（num_api.main）から呼び出す
+"""
+import sys
+
+_configured = False
+
+
+def configure_utf8_stdio() -> None:
+    """Windows環境で標準出力・標準エラーをUTF-8にする（2回目以降は何もしない）"""
+    global _configured
+    if _configured:
+        return
+    _configured = True
+    
+    if sys.platform != 'win32':
+        return
+    
+    for stream in (sys.stdout, sys.stderr):
+        # TextIOWrapperを作り直さず、既存のストリームのエンコーディングを切り替える
+        reconfigure = getattr(stream, 'reconfigure', None)
+        if reconfigure is not None and (getattr(stream, 'encoding', '') or '').lower() != 'utf-8':
+            reconfigure(encoding='utf-8')
@@ -3,9 +3,44 @@
 生命の樹に基づく計算
 """
 from datetime import datetime
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 from ...models.output_schema import KabbalahResult
+from ._jit_kernels import single_digit_table
+
+
+def _build_gematria_luts(table: Dict[str, int]) -> Tuple[bytes, bytes]:
+    """
+    英字→ゲマトリア値のbytes.translate用テーブルを作成
+    
+    値は1バイトに収まらない（R=200等）ため、十の位と一の位の2表に分ける。
+    合計は 10 * sum(十の位) + sum(一の位) で求まる（対象外の文字は0）
+    """
+    tens = bytearray(256)
+    ones = bytearray(256)
+    for char, value in table.items():
+        tens[ord(char)], ones[ord(char)] = divmod(value, 10)
+    return bytes(tens), bytes(ones)
+
+
+@lru_cache(maxsize=8192)
+def _reduce_to_single(num: int) -> int:
+    """1-9に還元（ただし22は保持）。KabbalahCalculator._reduce_to_singleの実体"""
+    if num == 22:
+        return 22
+    while num > 9:
+        digit_sum = 0
+        while num:
+            digit_sum += num % 10
+            num //= 10
+        num = digit_sum
+    return num if num > 0 else 1
+
+
+# 生年月日・名前の合計として現れる範囲（0-9999）は事前計算した表を引く
+_SINGLE_TABLE_SIZE = 10000
+_SINGLE_TABLE = tuple(single_digit_table(_SINGLE_TABLE_SIZE, 22).tolist())
 
 
 class KabbalahCalculator:
@@ -27,9 +62,10 @@ class KabbalahCalculator:
         'Q': 100, 'R': 200, 'S': 60, 'T': 9, 'U': 6, 'V': 6, 'W': 6, 'X': 60,
         'Y': 10, 'Z': 7
     }
+    _GEMATRIA_TENS, _GEMATRIA_ONES = _build_gematria_luts(ENGLISH_TO_HEBREW)
     
     # 生命の樹のセフィロト
-    SEPHIROT = [
+    SEPHIROT = (
         "ケテル（王冠）",
         "コクマー（知恵）",
         "ビナー（理解）",
@@ -40,14 +76,28 @@ class KabbalahCalculator:
         "ホド（栄光）",
         "イェソド（基盤）",
         "マルクト（王国）"
-    ]
+    )
     
     # パス（22本）
-    PATHS = [
+    PATHS = (
         "アレフ", "ベト", "ギメル", "ダレト", "ヘー", "ヴァヴ", "ザイン",
         "ケト", "テト", "ヨッド", "カフ", "ラメド", "メム", "ヌン",
         "サメフ", "アイン", "ペー", "ツァディ", "コフ", "レーシュ", "シン", "タヴ"
-    ]
+    )
+    
+    # セフィラの意味
+    SEPHIRA_MEANINGS = {
+        1: "神性・根源・無限の光",
+        2: "知恵・始まり・男性原理",
+        3: "理解・形成・女性原理",
+        4: "慈悲・拡大・恵み",
+        5: "力・厳格・制限",
+        6: "調和・美・中心",
+        7: "勝利・永遠・感情",
+        8: "栄光・輝き・知性",
+        9: "基盤・夢・無意識",
+        10: "王国・物質界・顕現"
+    }
     
     def __init__(self):
         pass
@@ -69,7 +119,7 @@ class KabbalahCalculator:
         # 名前から計算
         if name_roman:
             personality = self._calc_from_name(name_roman)
-            destiny = self._calc_destiny(birth_dt, name_roman)
+            destiny = self._calc_destiny(soul_number, name_roman)
         else:
             personality = soul_number
             destiny = soul_number
@@ -91,23 +141,28 @@ class KabbalahCalculator:
     
     def _calc_from_name(self, name: str) -> int:
         """名前からカバラ数を計算（ゲマトリア）"""
-        name = name.upper().replace(' ', '')
-        total = sum(self.ENGLISH_TO_HEBREW.get(c, 0) for c in name)
+        # 英字以外（空白・非ASCII）は値0なので除去不要
+        name_bytes = name.upper().encode('ascii', 'ignore')
+        total = (
+            10 * sum(name_bytes.translate(self._GEMATRIA_TENS))
+            + sum(name_bytes.translate(self._GEMATRIA_ONES))
+        )
         return self._reduce_to_single(total)
     
-    def _calc_destiny(self, birth_dt: datetime, name: str) -> int:
-        """運命数を計算（生年月日 + 名前）"""
-        soul = self._calc_soul_from_date(birth_dt)
+    def _calc_destiny(self, soul_number: int, name: str) -> int:
+        """運命数を計算（計算済みの魂数 + 名前）"""
         name_num = self._calc_from_name(name)
-        return self._reduce_to_single(soul + name_num)
+        return self._reduce_to_single(soul_number + name_num)
+    
+    def _calc_destiny_from_date(self, birth_dt: datetime, name: str) -> int:
+        """運命数を計算（生年月日 + 名前）"""
+        return self._calc_destiny(self._calc_soul_from_date(birth_dt), name)
     
     def _reduce_to_single(self, num: int) -> int:
         """1-9に還元（ただし22は保持）"""
-        if num == 22:
-            return 22
-        while num > 9:
-            num = sum(int(d) for d in str(num))
-        return num if num > 0 else 1
+        if 0 <= num < _SINGLE_TABLE_SIZE:
+            return _SINGLE_TABLE[num]
+        return _reduce_to_single(num)
     
     def _find_path_positions(self, soul: int, personality: int, destiny: int) -> List[str]:
         """生命の樹上のパス位置を特定"""
@@ -126,16 +181,4 @@ class KabbalahCalculator:
     
     def get_sephira_meaning(self, number: int) -> str:
         """セフィラの意味を取得"""
-        meanings = {
-            1: "神性・根源・無限の光",
-            2: "知恵・始まり・男性原理",
-            3: "理解・形成・女性原理",
-            4: "慈悲・拡大・恵み",
-            5: "力・厳格・制限",
-            6: "調和・美・中心",
-            7: "勝利・永遠・感情",
-            8: "栄光・輝き・知性",
-            9: "基盤・夢・無意識",
-            10: "王国・物質界・顕現"
-        }
-        return meanings.get(number, "")
+        return self.SEPHIRA_MEANINGS.get(number, "")
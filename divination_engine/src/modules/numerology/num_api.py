@@ -5,17 +5,10 @@ Numerology API Entry Point
 完全な数秘術レポートをJSON形式で生成
 """
 from typing import Dict, Optional
+from bisect import bisect_left
 from datetime import datetime
+from functools import lru_cache
 import json
-import sys
-import io
-
-# Windows環境でのUTF-8出力対応（安全版）
-if sys.platform == 'win32':
-    if hasattr(sys.stdout, 'buffer') and not isinstance(sys.stdout, io.TextIOWrapper):
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    if hasattr(sys.stderr, 'buffer') and not isinstance(sys.stderr, io.TextIOWrapper):
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
 try:
     import swisseph as swe
@@ -23,6 +16,12 @@ try:
 except ImportError:
     HAS_SWISSEPH = False
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ._win_utf8 import configure_utf8_stdio
 from .num_logic import ChartBuilder, AstroWeighting
 from .num_core import NumerologyCore
 from ...const.numerology_const import (
@@ -32,6 +31,191 @@ from ...const.numerology_const import (
 )
 
 
+# 計算クラスは状態を持たない（ChartBuilderは計算方式のみ）ため、モジュールで共有する
+_CORE = NumerologyCore()
+_ASTRO = AstroWeighting()
+_BUILDERS = {system: ChartBuilder(system) for system in ('pythagorean', 'chaldean')}
+
+
+def _get_builder(system: str) -> ChartBuilder:
+    """計算方式に対応するChartBuilderを取得（既定の2方式以外はその都度作成）"""
+    builder = _BUILDERS.get(system)
+    if builder is None:
+        builder = ChartBuilder(system)
+    return builder
+
+
+@lru_cache(maxsize=2048)
+def _full_report_cached(
+    name_input: str,
+    birth_iso: str,
+    system: str,
+    target_year: int,
+    include_astro: bool = True
+) -> Dict:
+    """
+    完全な数秘術レポートを生成（LRUキャッシュ付き）
+    
+    返り値はキャッシュで共有されるため、呼び出し側で変更しないこと
+    （NumerologyAPI.generate_full_reportは複製を返す）
+    """
+    birth_date = datetime.fromisoformat(birth_iso)
+    
+    builder = _get_builder(system)
+    astro = _ASTRO
+    core = _CORE
+    
+    # 日本語判定とローマ字変換
+    if core.is_japanese(name_input):
+        name_roman = core.kana_to_romaji(name_input)
+    else:
+        name_roman = name_input.upper()
+    
+    # ============================================
+    # Core Numbers計算
+    # ============================================
+    
+    # 名前は一度だけ走査して全文字・母音・子音の数値を共有する
+    decoded = core.decode_name(name_roman, system)
+    
+    life_path_data = builder.calc_life_path(birth_date)
+    destiny_data = builder.calc_destiny(name_roman, decoded)
+    soul_urge_data = builder.calc_soul_urge(name_roman, decoded)
+    personality_data = builder.calc_personality(name_roman, decoded)
+    maturity = builder.calc_maturity(
+        life_path_data['number'],
+        destiny_data['number']
+    )
+    birthday_number = builder.calc_birthday_number(birth_date.day)
+    
+    # ============================================
+    # 天体連携
+    # ============================================
+    
+    # ライフパス数の支配星
+    life_path_planet = astro.get_ruler_planet(life_path_data['number'])
+    
+    # 支配星の状態（天体計算が最も重いため、不要なら省略してNone）
+    planet_status = None
+    if include_astro:
+        # ユリウス日計算
+        if HAS_SWISSEPH:
+            jd = swe.julday(
+                birth_date.year,
+                birth_date.month,
+                birth_date.day,
+                birth_date.hour + birth_date.minute / 60.0
+            )
+        else:
+            jd = 0.0
+        planet_status = astro.evaluate_planet_strength(jd, life_path_planet)
+    
+    # ============================================
+    # Personal Year
+    # ============================================
+    
+    personal_year = builder.calc_personal_year(birth_date, target_year)
+    personal_year_meaning = PERSONAL_YEAR_MEANINGS.get(personal_year, {})
+    
+    # ============================================
+    # Pinnacles & Challenges
+    # ============================================
+    
+    pinnacles = builder.calc_pinnacles(birth_date, life_path_data['number'])
+    challenges = builder.calc_challenges(birth_date)
+    
+    # 現在のピナクル判定
+    current_age = target_year - birth_date.year
+    # 終了年齢は昇順（最後のピナクルは終了なし）なので二分探索で求める
+    end_ages = [p['end_age'] for p in pinnacles[:-1]]
+    current_pinnacle = pinnacles[bisect_left(end_ages, current_age)]
+    
+    # ============================================
+    # Grid Matrix
+    # ============================================
+    
+    grid = builder.calc_grid_matrix(birth_date, name_roman, decoded)
+    
+    # ============================================
+    # Karmic Detection
+    # ============================================
+    
+    karmic_numbers = core.detect_karmic(birth_date, decoded.values)
+    
+    # ============================================
+    # JSON構築
+    # ============================================
+    
+    return {
+        'profile': {
+            'name_input': name_input,
+            'name_roman': name_roman,
+            'birth_date': birth_date.isoformat(),
+            'system': system.capitalize(),
+            'target_year': target_year
+        },
+        'core_numbers': {
+            'life_path': {
+                'number': life_path_data['number'],
+                'is_master': life_path_data['is_master'],
+                'calculation': life_path_data['calculation'],
+                'ruler_planet': life_path_planet,
+                'planet_status': planet_status,
+                'meaning': NUMBER_MEANINGS.get(life_path_data['number'], {})
+            },
+            'destiny': {
+                'number': destiny_data['number'],
+                'is_master': destiny_data['is_master'],
+                'meaning': NUMBER_MEANINGS.get(destiny_data['number'], {}).get('keywords', [])
+            },
+            'soul_urge': {
+                'number': soul_urge_data['number'],
+                'is_master': soul_urge_data['is_master'],
+                'meaning': NUMBER_MEANINGS.get(soul_urge_data['number'], {}).get('keywords', [])
+            },
+            'personality': {
+                'number': personality_data['number'],
+                'is_master': personality_data['is_master'],
+                'meaning': NUMBER_MEANINGS.get(personality_data['number'], {}).get('keywords', [])
+            },
+            'maturity': {
+                'number': maturity,
+                'meaning': NUMBER_MEANINGS.get(maturity, {}).get('keywords', [])
+            },
+            'birthday': {
+                'number': birthday_number,
+                'meaning': NUMBER_MEANINGS.get(birthday_number, {}).get('keywords', [])
+            },
+            'karmic_lessons': [
+                {
+                    'number': k,
+                    **KARMIC_MEANINGS.get(k, {})
+                } for k in karmic_numbers
+            ]
+        },
+        'forecasting': {
+            'personal_year': {
+                'number': personal_year,
+                'theme': personal_year_meaning.get('theme', ''),
+                'description': personal_year_meaning.get('description', '')
+            },
+            'current_pinnacle': current_pinnacle,
+            'all_pinnacles': pinnacles,
+            'challenges': challenges
+        },
+        'grid_matrix': grid
+    }
+
+
+def _copy_report(obj):
+    """レポートのdict/listを再帰的に複製（copy.deepcopyより軽量）"""
+    if type(obj) is dict:
+        return {k: _copy_report(v) for k, v in obj.items()}
+    if type(obj) is list:
+        return [_copy_report(v) for v in obj]
+    return obj
+
+
 class NumerologyAPI:
     """
     数秘術API
@@ -49,7 +233,8 @@ class NumerologyAPI:
         system: str = 'pythagorean',
         target_year: Optional[int] = None,
         latitude: float = 35.68,
-        longitude: float = 139.76
+        longitude: float = 139.76,
+        include_astro: bool = True
     ) -> Dict:
         """
         完全な数秘術レポートを生成
@@ -61,154 +246,27 @@ class NumerologyAPI:
             target_year: 予測対象年（Noneなら現在年）
             latitude: 出生地緯度（天体計算用、未使用でもよい）
             longitude: 出生地経度（天体計算用、未使用でもよい）
+            include_astro: 支配星の状態（planet_status）を天体計算で求めるか
+                （Falseならplanet_statusはNone）
             
         Returns:
             完全なJSON形式レポート
         """
-        builder = ChartBuilder(system)
-        astro = AstroWeighting()
-        core = NumerologyCore()
-        
-        # 日本語判定とローマ字変換
-        if core.is_japanese(name_input):
-            name_roman = core.kana_to_romaji(name_input)
-        else:
-            name_roman = name_input.upper()
-        
-        # ============================================
-        # Core Numbers計算
-        # ============================================
-        
-        life_path_data = builder.calc_life_path(birth_date)
-        destiny_data = builder.calc_destiny(name_roman)
-        soul_urge_data = builder.calc_soul_urge(name_roman)
-        personality_data = builder.calc_personality(name_roman)
-        maturity = builder.calc_maturity(
-            life_path_data['number'],
-            destiny_data['number']
-        )
-        birthday_number = builder.calc_birthday_number(birth_date.day)
-        
-        # ============================================
-        # 天体連携
-        # ============================================
-        
-        # ユリウス日計算
-        if HAS_SWISSEPH:
-            jd = swe.julday(
-                birth_date.year,
-                birth_date.month,
-                birth_date.day,
-                birth_date.hour + birth_date.minute / 60.0
-            )
-        else:
-            jd = 0.0
-        
-        # ライフパス数の支配星
-        life_path_planet = astro.get_ruler_planet(life_path_data['number'])
-        planet_status = astro.evaluate_planet_strength(jd, life_path_planet)
-        
-        # ============================================
-        # Personal Year
-        # ============================================
-        
         if target_year is None:
             target_year = datetime.now().year
         
-        personal_year = builder.calc_personal_year(birth_date, target_year)
-        personal_year_meaning = PERSONAL_YEAR_MEANINGS.get(personal_year, {})
-        
-        # ============================================
-        # Pinnacles & Challenges
-        # ============================================
-        
-        pinnacles = builder.calc_pinnacles(birth_date)
-        challenges = builder.calc_challenges(birth_date)
-        
-        # 現在のピナクル判定
-        current_age = target_year - birth_date.year
-        current_pinnacle = None
-        for p in pinnacles:
-            if p['end_age'] is None or current_age <= p['end_age']:
-                current_pinnacle = p
-                break
-        
-        # ============================================
-        # Grid Matrix
-        # ============================================
-        
-        grid = builder.calc_grid_matrix(birth_date, name_roman)
-        
-        # ============================================
-        # Karmic Detection
-        # ============================================
-        
-        all_name_numbers = core.text_to_number(name_roman, system)
-        karmic_numbers = core.detect_karmic(birth_date, all_name_numbers)
-        
-        # ============================================
-        # JSON構築
-        # ============================================
-        
-        return {
-            'profile': {
-                'name_input': name_input,
-                'name_roman': name_roman,
-                'birth_date': birth_date.isoformat(),
-                'system': system.capitalize(),
-                'target_year': target_year
-            },
-            'core_numbers': {
-                'life_path': {
-                    'number': life_path_data['number'],
-                    'is_master': life_path_data['is_master'],
-                    'calculation': life_path_data['calculation'],
-                    'ruler_planet': life_path_planet,
-                    'planet_status': planet_status,
-                    'meaning': NUMBER_MEANINGS.get(life_path_data['number'], {})
-                },
-                'destiny': {
-                    'number': destiny_data['number'],
-                    'is_master': destiny_data['is_master'],
-                    'meaning': NUMBER_MEANINGS.get(destiny_data['number'], {}).get('keywords', [])
-                },
-                'soul_urge': {
-                    'number': soul_urge_data['number'],
-                    'is_master': soul_urge_data['is_master'],
-                    'meaning': NUMBER_MEANINGS.get(soul_urge_data['number'], {}).get('keywords', [])
-                },
-                'personality': {
-                    'number': personality_data['number'],
-                    'is_master': personality_data['is_master'],
-                    'meaning': NUMBER_MEANINGS.get(personality_data['number'], {}).get('keywords', [])
-                },
-                'maturity': {
-                    'number': maturity,
-                    'meaning': NUMBER_MEANINGS.get(maturity, {}).get('keywords', [])
-                },
-                'birthday': {
-                    'number': birthday_number,
-                    'meaning': NUMBER_MEANINGS.get(birthday_number, {}).get('keywords', [])
-                },
-                'karmic_lessons': [
-                    {
-                        'number': k,
-                        **KARMIC_MEANINGS.get(k, {})
-                    } for k in karmic_numbers
-                ]
-            },
-            'forecasting': {
-                'personal_year': {
-                    'number': personal_year,
-                    'theme': personal_year_meaning.get('theme', ''),
-                    'description': personal_year_meaning.get('description', '')
-                },
-                'current_pinnacle': current_pinnacle,
-                'all_pinnacles': pinnacles,
-                'challenges': challenges
-            },
-            'grid_matrix': grid
-        }
+        # 結果は入力だけで決まるためキャッシュし、呼び出し側には複製を返す
+        # （aware datetimeは同一時刻なら等価になるため、キーはisoformat文字列にする。
+        #   出生地はレポートに使われないためキーに含めない）
+        report = _full_report_cached(
+            name_input, birth_date.isoformat(), system, target_year, include_astro
+        )
+        return _copy_report(report)
+    
+    @staticmethod
+    def cache_info():
+        """generate_full_reportのキャッシュ統計（監視用）"""
+        return _full_report_cached.cache_info()
     
     def generate_simple_report(
         self,
@@ -227,8 +285,8 @@ class NumerologyAPI:
         Returns:
             簡易JSON形式レポート
         """
-        builder = ChartBuilder(system)
-        core = NumerologyCore()
+        builder = _get_builder(system)
+        core = _CORE
         
         # 日本語判定
         if core.is_japanese(name_input):
@@ -237,10 +295,11 @@ class NumerologyAPI:
             name_roman = name_input.upper()
         
         # Core Numbers only
+        decoded = core.decode_name(name_roman, system)
         life_path_data = builder.calc_life_path(birth_date)
-        destiny_data = builder.calc_destiny(name_roman)
-        soul_urge_data = builder.calc_soul_urge(name_roman)
-        personality_data = builder.calc_personality(name_roman)
+        destiny_data = builder.calc_destiny(name_roman, decoded)
+        soul_urge_data = builder.calc_soul_urge(name_roman, decoded)
+        personality_data = builder.calc_personality(name_roman, decoded)
         
         return {
             'name': name_roman,
@@ -257,6 +316,14 @@ class NumerologyAPI:
 # コマンドライン実行用
 # ============================================
 
+def _dumps(obj) -> str:
+    """レポートをインデント付きJSON文字列にする（orjsonがあれば使用）"""
+    if orjson is not None:
+        # grid_matrixは整数キーのためOPT_NON_STR_KEYSが必要
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
 def main():
     """
     コマンドライン実行テスト
@@ -266,6 +333,9 @@ def main():
     """
     import argparse
     
+    # Windows環境でのUTF-8出力対応（CLI実行時のみ）
+    configure_utf8_stdio()
+    
     parser = argparse.ArgumentParser(description='Numerology Calculator')
     parser.add_argument('--name', type=str, required=True, help='Full name')
     parser.add_argument('--date', type=str, required=True, help='Birth date (YYYY-MM-DD)')
@@ -285,7 +355,7 @@ def main():
     )
     
     # JSON出力
-    print(json.dumps(result, indent=2, ensure_ascii=False))
+    print(_dumps(result))
 
 
 if __name__ == '__main__':
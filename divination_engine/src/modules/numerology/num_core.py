@@ -11,27 +11,174 @@ Numerology Core Engine
 - 日本語ローマ字変換
 - カルマナンバー検出
 """
-from typing import List, Tuple, Optional, Set
+from typing import List, NamedTuple, Tuple, Optional, Set
 from datetime import datetime
-import sys
-import io
-
-# Windows環境でのUTF-8出力対応（安全版）
-if sys.platform == 'win32':
-    if hasattr(sys.stdout, 'buffer') and not isinstance(sys.stdout, io.TextIOWrapper):
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    if hasattr(sys.stderr, 'buffer') and not isinstance(sys.stderr, io.TextIOWrapper):
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+from functools import lru_cache
+import re
 
+from ._jit_kernels import reduce_table
 from ...const.numerology_const import (
     PYTHAGOREAN_TABLE,
     CHALDEAN_TABLE,
     VOWELS,
     MASTER_NUMBERS,
-    KARMIC_NUMBERS
+    KARMIC_NUMBERS,
+    MASTER_MASK,
+    KARMIC_MASK
 )
 
 
+# ============================================
+# かな→ローマ字変換テーブル（簡易版）
+# ============================================
+
+# ひらがな→ヘボン式ローマ字
+_HIRAGANA_TO_ROMAJI = {
+    'あ': 'a', 'い': 'i', 'う': 'u', 'え': 'e', 'お': 'o',
+    'か': 'ka', 'き': 'ki', 'く': 'ku', 'け': 'ke', 'こ': 'ko',
+    'が': 'ga', 'ぎ': 'gi', 'ぐ': 'gu', 'げ': 'ge', 'ご': 'go',
+    'さ': 'sa', 'し': 'shi', 'す': 'su', 'せ': 'se', 'そ': 'so',
+    'ざ': 'za', 'じ': 'ji', 'ず': 'zu', 'ぜ': 'ze', 'ぞ': 'zo',
+    'た': 'ta', 'ち': 'chi', 'つ': 'tsu', 'て': 'te', 'と': 'to',
+    'だ': 'da', 'ぢ': 'ji', 'づ': 'zu', 'で': 'de', 'ど': 'do',
+    'な': 'na', 'に': 'ni', 'ぬ': 'nu', 'ね': 'ne', 'の': 'no',
+    'は': 'ha', 'ひ': 'hi', 'ふ': 'fu', 'へ': 'he', 'ほ': 'ho',
+    'ば': 'ba', 'び': 'bi', 'ぶ': 'bu', 'べ': 'be', 'ぼ': 'bo',
+    'ぱ': 'pa', 'ぴ': 'pi', 'ぷ': 'pu', 'ぺ': 'pe', 'ぽ': 'po',
+    'ま': 'ma', 'み': 'mi', 'む': 'mu', 'め': 'me', 'も': 'mo',
+    'や': 'ya', 'ゆ': 'yu', 'よ': 'yo',
+    'ら': 'ra', 'り': 'ri', 'る': 'ru', 'れ': 're', 'ろ': 'ro',
+    'わ': 'wa', 'を': 'wo', 'ん': 'n',
+    'ゃ': 'ya', 'ゅ': 'yu', 'ょ': 'yo',
+    'っ': '',  # 促音は次の子音を重ねる（簡略化）
+    'ー': '',  # 長音記号
+    ' ': ' ', '　': ' '
+}
+
+# カタカナ→ひらがな（同じ位置の文字が対応）
+_KATAKANA = 'アイウエオカキクケコガギグゲゴサシスセソザジズゼゾタチツテトダヂヅデドナニヌネノハヒフヘホバビブベボパピプペポマミムメモヤユヨラリルレロワヲンャュョッー'
+_HIRAGANA = 'あいうえおかきくけこがぎぐげごさしすせそざじずぜぞたちつてとだぢづでどなにぬねのはひふへほばびぶべぼぱぴぷぺぽまみむめもやゆよらりるれろわをんゃゅょっー'
+_KATAKANA_TO_HIRAGANA = dict(zip(_KATAKANA, _HIRAGANA))
+
+# ひらがな・カタカナを直接ローマ字にする1パス変換表（未登録の文字はそのまま）
+_KANA_TO_ROMAJI = str.maketrans({
+    **_HIRAGANA_TO_ROMAJI,
+    **{k: _HIRAGANA_TO_ROMAJI[h] for k, h in _KATAKANA_TO_HIRAGANA.items()}
+})
+
+# 拗音（2文字）→ローマ字（ヘボン式）
+_YOON_ROMAJI_BASE = {
+    'きゃ': 'kya', 'きゅ': 'kyu', 'きょ': 'kyo',
+    'ぎゃ': 'gya', 'ぎゅ': 'gyu', 'ぎょ': 'gyo',
+    'しゃ': 'sha', 'しゅ': 'shu', 'しょ': 'sho',
+    'じゃ': 'ja', 'じゅ': 'ju', 'じょ': 'jo',
+    'ちゃ': 'cha', 'ちゅ': 'chu', 'ちょ': 'cho',
+    'ぢゃ': 'ja', 'ぢゅ': 'ju', 'ぢょ': 'jo',
+    'にゃ': 'nya', 'にゅ': 'nyu', 'にょ': 'nyo',
+    'ひゃ': 'hya', 'ひゅ': 'hyu', 'ひょ': 'hyo',
+    'びゃ': 'bya', 'びゅ': 'byu', 'びょ': 'byo',
+    'ぴゃ': 'pya', 'ぴゅ': 'pyu', 'ぴょ': 'pyo',
+    'みゃ': 'mya', 'みゅ': 'myu', 'みょ': 'myo',
+    'りゃ': 'rya', 'りゅ': 'ryu', 'りょ': 'ryo',
+}
+_HIRAGANA_TO_KATAKANA = {h: k for k, h in _KATAKANA_TO_HIRAGANA.items()}
+# ひらがな・カタカナの混在（キゃ等）も含めた全組み合わせ
+_YOON_ROMAJI = {
+    a + b: romaji
+    for pair, romaji in _YOON_ROMAJI_BASE.items()
+    for a in (pair[0], _HIRAGANA_TO_KATAKANA[pair[0]])
+    for b in (pair[1], _HIRAGANA_TO_KATAKANA[pair[1]])
+}
+_YOON_RE = re.compile('|'.join(_YOON_ROMAJI))
+
+# 日本語文字（ひらがな U+3040-309F / カタカナ U+30A0-30FF / 漢字 U+4E00-9FFF）
+_JAPANESE_RE = re.compile('[\u3040-\u30FF\u4E00-\u9FFF]')
+
+
+def _yoon_to_romaji(match: 're.Match') -> str:
+    return _YOON_ROMAJI[match.group()]
+
+
+
+# ============================================
+# 英字→数値の母音/子音別ルックアップテーブル
+# ============================================
+
+_ORD_Y = ord('Y')
+_ORD_REPLACED = ord('?')  # encode('ascii', 'replace')の置換文字
+
+# バイト値 → 母音（AEIOU）なら1、それ以外は0（bytes.translate用）
+_IS_VOWEL = bytes(1 if chr(i) in VOWELS else 0 for i in range(256))
+
+# カルマナンバー（detect_karmic用、昇順）
+_KARMIC_SORTED = tuple(sorted(KARMIC_NUMBERS))
+
+
+# 子音として扱うYの置き換え先（ASCII外のバイトなので入力とは衝突しない）
+_CONSONANT_Y = 0x80
+
+
+def _build_letter_luts(table) -> Tuple[bytes, bytes]:
+    """
+    バイト値 → (母音の数値, 子音の数値) の256要素テーブルを作成
+    
+    該当しない側・英字以外は0。Yは前後の文字で判定が変わるため母音側に値を置き、
+    子音と判定したYは_CONSONANT_Yに置き換えて子音側で引く
+    """
+    vowel_lut = bytearray(256)
+    consonant_lut = bytearray(256)
+    for char, value in table.items():
+        if char in VOWELS or char == 'Y':
+            vowel_lut[ord(char)] = value
+        else:
+            consonant_lut[ord(char)] = value
+    consonant_lut[_CONSONANT_Y] = table['Y']
+    return bytes(vowel_lut), bytes(consonant_lut)
+
+
+_PYTHAGOREAN_LUTS = _build_letter_luts(PYTHAGOREAN_TABLE)
+_CHALDEAN_LUTS = _build_letter_luts(CHALDEAN_TABLE)
+
+# 母音・子音を区別しない バイト値 → 数値 の変換表（text_to_number用）
+_PYTHAGOREAN_VALUE_LUT = bytes(v | c for v, c in zip(*_PYTHAGOREAN_LUTS))
+_CHALDEAN_VALUE_LUT = bytes(v | c for v, c in zip(*_CHALDEAN_LUTS))
+
+
+# ============================================
+# 数値還元
+# ============================================
+
+@lru_cache(maxsize=8192)
+def _reduce(n: int, keep_master: bool) -> int:
+    """数値を1桁に還元（NumerologyCore.reduce_numberの実体）"""
+    if not keep_master and n > 9:
+        # マスターナンバーを保持しない還元は数根そのもの
+        return 1 + (n - 1) % 9
+    while n > 9:
+        if keep_master and (MASTER_MASK >> n) & 1:
+            return n
+        digit_sum = 0
+        while n:
+            digit_sum += n % 10
+            n //= 10
+        n = digit_sum
+    return n
+
+
+# 名前・生年月日の合計として現れる範囲（0-9999）は事前計算した表を引く
+_REDUCE_TABLE_SIZE = 10000
+_MASTER_TUPLE = tuple(sorted(MASTER_NUMBERS))
+_REDUCE_TABLE = tuple(reduce_table(_REDUCE_TABLE_SIZE, _MASTER_TUPLE, True).tolist())
+_REDUCE_TABLE_NO_MASTER = tuple(reduce_table(_REDUCE_TABLE_SIZE, _MASTER_TUPLE, False).tolist())
+
+
+class NameDecode(NamedTuple):
+    """名前の数値化結果（NumerologyCore.decode_name）"""
+    values: List[int]       # 全文字の数値（text_to_numberと同じ）
+    vowels: List[int]       # 母音の数値（Y判定適用済み）
+    consonants: List[int]   # 子音の数値
+
+
 class NumerologyCore:
     """
     数秘術コア計算クラス
@@ -61,11 +208,9 @@ class NumerologyCore:
             >>> reduce_number(29, keep_master=False)  # 2+9=11, 1+1=2
             2
         """
-        while n > 9:
-            if keep_master and n in MASTER_NUMBERS:
-                return n
-            n = sum(int(d) for d in str(n))
-        return n
+        if 0 <= n < _REDUCE_TABLE_SIZE:
+            return (_REDUCE_TABLE if keep_master else _REDUCE_TABLE_NO_MASTER)[n]
+        return _reduce(n, keep_master)
     
     def text_to_number(
         self, 
@@ -88,10 +233,28 @@ class NumerologyCore:
             >>> text_to_number("JOHN", "chaldean")
             [1, 7, 5, 5]
         """
-        table = CHALDEAN_TABLE if system == 'chaldean' else PYTHAGOREAN_TABLE
         text = text.upper().replace(' ', '').replace('-', '')
         
-        return [table.get(c, 0) for c in text if c.isalpha()]
+        # ASCIIのみなら英字以外を0にするバイト変換表で一括変換（英字の値は常に1以上）
+        if text.isascii():
+            value_lut = _CHALDEAN_VALUE_LUT if system == 'chaldean' else _PYTHAGOREAN_VALUE_LUT
+            return list(text.encode('ascii').translate(value_lut).replace(b'\x00', b''))
+        
+        # 非ASCIIの英字は値0として数える（ループ内の属性参照を避けるためメソッドを先に束縛）
+        get = (CHALDEAN_TABLE if system == 'chaldean' else PYTHAGOREAN_TABLE).get
+        return [get(c, 0) for c in text if c.isalpha()]
+    
+    def text_sum(self, text: str, system: str = 'pythagorean') -> int:
+        """
+        テキストの数値合計（sum(text_to_number(text, system))と同じ）
+        
+        合計だけが必要な場合用。ASCIIのみならリストを作らずバイト変換表の合計で求める
+        """
+        text = text.upper()
+        if text.isascii():
+            value_lut = _CHALDEAN_VALUE_LUT if system == 'chaldean' else _PYTHAGOREAN_VALUE_LUT
+            return sum(text.encode('ascii').translate(value_lut))
+        return sum(self.text_to_number(text, system))
     
     def analyze_y_vowel(self, word: str, index: int) -> bool:
         """
@@ -177,34 +340,74 @@ class NumerologyCore:
             >>> separate_vowels_consonants("MARY")
             ([1, 7], [4, 9])  # A,Y (vowels) | M,R (consonants)
         """
-        table = CHALDEAN_TABLE if system == 'chaldean' else PYTHAGOREAN_TABLE
+        decoded = self.decode_name(text, system)
+        return decoded.vowels, decoded.consonants
+    
+    def decode_name(self, text: str, system: str = 'pythagorean') -> 'NameDecode':
+        """
+        名前を1回の走査で数値化し、全文字・母音・子音の数値リストをまとめて返す
+        
+        text_to_number と separate_vowels_consonants の結果を同時に求める
+        （チャート計算で名前を何度も走査しないため）
+        
+        Args:
+            text: 名前（アルファベット）
+            system: 'pythagorean' or 'chaldean'
+            
+        Returns:
+            NameDecode(values, vowels, consonants)
+        """
+        vowel_lut, consonant_lut = _CHALDEAN_LUTS if system == 'chaldean' else _PYTHAGOREAN_LUTS
         text = text.upper().replace(' ', '').replace('-', '')
+        # 非ASCII文字は'?'（1文字1バイト）に置換して位置を保つ（Y判定で前後の文字を参照するため）
+        data = text.encode('ascii', 'replace')
+        # 各位置が母音（AEIOU）かどうかのマスク（Y判定用、末尾に番兵0を追加）
+        vowel_mask = data.translate(_IS_VOWEL) + b'\x00'
+        
+        # ASCIIのみなら子音扱いのYだけ置き換え、母音・子音・全体をバイト変換表で一括変換
+        if text.isascii():
+            y_index = data.find(b'Y')
+            if y_index >= 0:
+                marked = bytearray(data)
+                while y_index >= 0:
+                    # analyze_y_vowelと同じ規則: 先頭でなく、前後がともに母音でなければ母音
+                    if not (y_index > 0 and not vowel_mask[y_index - 1] and not vowel_mask[y_index + 1]):
+                        marked[y_index] = _CONSONANT_Y
+                    y_index = data.find(b'Y', y_index + 1)
+                data = bytes(marked)
+            value_lut = _CHALDEAN_VALUE_LUT if system == 'chaldean' else _PYTHAGOREAN_VALUE_LUT
+            return NameDecode(
+                list(data.translate(value_lut).replace(b'\x00', b'')),
+                list(data.translate(vowel_lut).replace(b'\x00', b'')),
+                list(data.translate(consonant_lut).replace(b'\x00', b''))
+            )
         
+        values = []
         vowels = []
         consonants = []
         
-        for i, c in enumerate(text):
-            if not c.isalpha():
-                continue
-                
-            value = table.get(c, 0)
-            if value == 0:
-                continue
-            
-            # Yの特殊処理
-            if c == 'Y':
-                if self.analyze_y_vowel(text, i):
+        for i, b in enumerate(data):
+            # Yの特殊処理（analyze_y_vowelと同じ規則: 先頭でなく、前後がともに母音でなければ母音）
+            if b == _ORD_Y:
+                value = vowel_lut[b]
+                values.append(value)
+                if i > 0 and not vowel_mask[i - 1] and not vowel_mask[i + 1]:
                     vowels.append(value)
                 else:
                     consonants.append(value)
-            # 通常の母音
-            elif c in VOWELS:
-                vowels.append(value)
-            # 子音
-            else:
-                consonants.append(value)
+            # 通常の母音（子音・英字以外は0）
+            elif vowel_lut[b]:
+                values.append(vowel_lut[b])
+                vowels.append(vowel_lut[b])
+            # 子音（母音・英字以外は0）
+            elif consonant_lut[b]:
+                values.append(consonant_lut[b])
+                consonants.append(consonant_lut[b])
+            # 表にない英字（非ASCII）はtext_to_numberと同じく0として数える
+            elif b == _ORD_REPLACED and text[i].isalpha():
+                values.append(0)
         
-        return vowels, consonants
+        return NameDecode(values, vowels, consonants)
     
     def detect_karmic(
         self, 
@@ -218,24 +421,26 @@ class NumerologyCore:
         
         Args:
             birth_date: 生年月日
-            name_numbers: 名前から算出された数値リスト
+            name_numbers: 名前から算出された数値リスト（現在の判定では未使用）
             
         Returns:
             カルマナンバーのリスト
         """
-        karmic_found = []
-        
-        # 生年月日の数字をすべて結合
-        date_str = birth_date.strftime('%Y%m%d')
-        all_numbers = [int(d) for d in date_str] + name_numbers
+        year, month, day = birth_date.year, birth_date.month, birth_date.day
         
-        # 連続する2桁の組み合わせをチェック
-        for i in range(len(date_str) - 1):
-            two_digit = int(date_str[i:i+2])
-            if two_digit in KARMIC_NUMBERS and two_digit not in karmic_found:
-                karmic_found.append(two_digit)
+        # YYYYMMDDの各桁（文字列化せず整数演算で取り出す）
+        digits = (
+            year // 1000 % 10, year // 100 % 10, year // 10 % 10, year % 10,
+            month // 10, month % 10,
+            day // 10, day % 10
+        )
         
-        return sorted(karmic_found)
+        # 連続する2桁の組み合わせをビットで集め、カルマナンバーのマスクと照合
+        pairs = 0
+        for i in range(7):
+            pairs |= 1 << (digits[i] * 10 + digits[i + 1])
+        karmic_found = pairs & KARMIC_MASK
+        return [k for k in _KARMIC_SORTED if (karmic_found >> k) & 1]
     
     def kana_to_romaji(self, text: str) -> str:
         """
@@ -249,65 +454,9 @@ class NumerologyCore:
         Returns:
             ローマ字（大文字）
         """
-        # 簡易変換テーブル（ひらがな）
-        HIRAGANA_TO_ROMAJI = {
-            'あ': 'a', 'い': 'i', 'う': 'u', 'え': 'e', 'お': 'o',
-            'か': 'ka', 'き': 'ki', 'く': 'ku', 'け': 'ke', 'こ': 'ko',
-            'が': 'ga', 'ぎ': 'gi', 'ぐ': 'gu', 'げ': 'ge', 'ご': 'go',
-            'さ': 'sa', 'し': 'shi', 'す': 'su', 'せ': 'se', 'そ': 'so',
-            'ざ': 'za', 'じ': 'ji', 'ず': 'zu', 'ぜ': 'ze', 'ぞ': 'zo',
-            'た': 'ta', 'ち': 'chi', 'つ': 'tsu', 'て': 'te', 'と': 'to',
-            'だ': 'da', 'ぢ': 'ji', 'づ': 'zu', 'で': 'de', 'ど': 'do',
-            'な': 'na', 'に': 'ni', 'ぬ': 'nu', 'ね': 'ne', 'の': 'no',
-            'は': 'ha', 'ひ': 'hi', 'ふ': 'fu', 'へ': 'he', 'ほ': 'ho',
-            'ば': 'ba', 'び': 'bi', 'ぶ': 'bu', 'べ': 'be', 'ぼ': 'bo',
-            'ぱ': 'pa', 'ぴ': 'pi', 'ぷ': 'pu', 'ぺ': 'pe', 'ぽ': 'po',
-            'ま': 'ma', 'み': 'mi', 'む': 'mu', 'め': 'me', 'も': 'mo',
-            'や': 'ya', 'ゆ': 'yu', 'よ': 'yo',
-            'ら': 'ra', 'り': 'ri', 'る': 'ru', 'れ': 're', 'ろ': 'ro',
-            'わ': 'wa', 'を': 'wo', 'ん': 'n',
-            'ゃ': 'ya', 'ゅ': 'yu', 'ょ': 'yo',
-            'っ': '',  # 促音は次の子音を重ねる（簡略化）
-            'ー': '',  # 長音記号
-            ' ': ' ', '　': ' '
-        }
-        
-        # カタカナも同じマッピング（ひらがなに変換してから処理）
-        KATAKANA_TO_HIRAGANA = str.maketrans(
-            'アイウエオカキクケコガギグゲゴサシスセソザジズゼゾタチツテトダヂヅデドナニヌネノハヒフヘホバビブベボパピプペポマミムメモヤユヨラリルレロワヲンャュョッー',
-            'あいうえおかきくけこがぎぐげごさしすせそざじずぜぞたちつてとだぢづでどなにぬねのはひふへほばびぶべぼぱぴぷぺぽまみむめもやゆよらりるれろわをんゃゅょっー'
-        )
-        
-        # カタカナをひらがなに変換
-        text = text.translate(KATAKANA_TO_HIRAGANA)
-        
-        # ローマ字変換
-        romaji = ''
-        i = 0
-        while i < len(text):
-            # 2文字先読み（拗音：きゃ、しゅ等）
-            if i < len(text) - 1:
-                two_char = text[i:i+2]
-                # 拗音の特殊処理
-                if two_char in ['きゃ', 'きゅ', 'きょ']:
-                    romaji += two_char.replace('き', 'k').replace('ゃ', 'ya').replace('ゅ', 'yu').replace('ょ', 'yo')
-                    i += 2
-                    continue
-                elif two_char in ['しゃ', 'しゅ', 'しょ']:
-                    romaji += two_char.replace('し', 'sh').replace('ゃ', 'a').replace('ゅ', 'u').replace('ょ', 'o')
-                    i += 2
-                    continue
-                elif two_char in ['ちゃ', 'ちゅ', 'ちょ']:
-                    romaji += two_char.replace('ち', 'ch').replace('ゃ', 'a').replace('ゅ', 'u').replace('ょ', 'o')
-                    i += 2
-                    continue
-            
-            # 1文字ずつ変換
-            char = text[i]
-            romaji += HIRAGANA_TO_ROMAJI.get(char, char)
-            i += 1
-        
-        return romaji.upper()
+        # 拗音（きゃ・しゅ等）を先に置換し、残りを1文字単位の変換表で一括変換
+        text = _YOON_RE.sub(_yoon_to_romaji, text)
+        return text.translate(_KANA_TO_ROMAJI).upper()
     
     def is_japanese(self, text: str) -> bool:
         """
@@ -319,13 +468,4 @@ class NumerologyCore:
         Returns:
             True: 日本語を含む
         """
-        for char in text:
-            # ひらがな: U+3040-309F
-            # カタカナ: U+30A0-30FF
-            # 漢字:     U+4E00-9FFF
-            code = ord(char)
-            if (0x3040 <= code <= 0x309F) or \
-               (0x30A0 <= code <= 0x30FF) or \
-               (0x4E00 <= code <= 0x9FFF):
-                return True
-        return False
+        return _JAPANESE_RE.search(text) is not None
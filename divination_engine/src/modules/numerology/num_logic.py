@@ -4,17 +4,11 @@ Numerology Business Logic
 
 チャート構築、天体連携、ピナクル・チャレンジ計算
 """
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
-import sys
-import io
+from functools import lru_cache
 
-# Windows環境でのUTF-8出力対応（安全版）
-if sys.platform == 'win32':
-    if hasattr(sys.stdout, 'buffer') and not isinstance(sys.stdout, io.TextIOWrapper):
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    if hasattr(sys.stderr, 'buffer') and not isinstance(sys.stderr, io.TextIOWrapper):
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+import numpy as np
 
 try:
     import swisseph as swe
@@ -23,21 +17,62 @@ except ImportError:
     HAS_SWISSEPH = False
     print("Warning: pyswisseph not installed. Astro weighting will be disabled.")
 
-from .num_core import NumerologyCore
+from ...core.jit import NUMBA_AVAILABLE
+from ._jit_kernels import cycle_numbers
+from .num_core import NameDecode, NumerologyCore
 from ...const.numerology_const import (
     MASTER_NUMBERS,
     PLANET_RULERS,
     PLANET_IDS,
     ZODIAC_SIGNS,
-    DOMICILE,
-    EXALTATION,
-    DETRIMENT,
-    FALL,
+    DIGNITY_NAMES,
+    DIGNITY_TABLE,
     NUMBER_MEANINGS,
     PERSONAL_YEAR_MEANINGS
 )
 
 
+# 品位コード（DIGNITY_NAMESの順）→ 惑星の強さスコア（品位なしは1.0）
+_DIGNITY_STRENGTH = (1.2, 1.1, 0.8, 0.7)
+
+
+# 天体計算ができない場合の惑星ステータス（AstroWeighting._dummy_planet_statusが共有で返す）
+_DUMMY_PLANET_STATUS = {
+    'sign': 'Unknown',
+    'sign_ja': '不明',
+    'degree': 0.0,
+    'is_retrograde': False,
+    'dignity': None,
+    'strength_score': 1.0
+}
+
+
+_CORE = NumerologyCore()
+
+
+@lru_cache(maxsize=4096)
+def _life_path_number(year: int, month: int, day: int) -> int:
+    """ライフパス数のみを計算（calc_life_pathの'number'と同じ、計算過程の文字列なし）"""
+    reduce_number = _CORE.reduce_number
+    total = reduce_number(year) + reduce_number(month) + reduce_number(day)
+    return reduce_number(total)
+
+
+@lru_cache(maxsize=1024)
+def _decode_name_cached(full_name: str, system: str) -> NameDecode:
+    """
+    名前の数値化結果を共有（calc_soul_urge と calc_personality で同じ名前を二度走査しない）
+    
+    キャッシュ上のリストを返すため、呼び出し側で書き換えないこと
+    """
+    return _CORE.decode_name(full_name, system)
+
+
+def _digital_root(values: np.ndarray) -> np.ndarray:
+    """マスターナンバーを保持しない還元（数根）を配列に適用"""
+    return np.where(values > 0, 1 + (values - 1) % 9, 0)
+
+
 class ChartBuilder:
     """
     数秘術チャート構築クラス
@@ -94,7 +129,7 @@ class ChartBuilder:
             'calculation': calc_str
         }
     
-    def calc_destiny(self, full_name: str) -> Dict:
+    def calc_destiny(self, full_name: str, decoded: Optional[NameDecode] = None) -> Dict:
         """
         Destiny (Expression) Number
         
@@ -102,12 +137,15 @@ class ChartBuilder:
         
         Args:
             full_name: フルネーム
+            decoded: decode_nameの結果（計算済みなら渡すと名前の再走査を省略）
             
         Returns:
             {'number': int, 'is_master': bool}
         """
-        numbers = self.core.text_to_number(full_name, self.system)
-        total = sum(numbers)
+        if decoded is None:
+            total = self.core.text_sum(full_name, self.system)
+        else:
+            total = sum(decoded.values)
         final = self.core.reduce_number(total)
         
         return {
@@ -115,7 +153,7 @@ class ChartBuilder:
             'is_master': final in MASTER_NUMBERS
         }
     
-    def calc_soul_urge(self, full_name: str) -> Dict:
+    def calc_soul_urge(self, full_name: str, decoded: Optional[NameDecode] = None) -> Dict:
         """
         Soul Urge (Heart's Desire)
         
@@ -123,11 +161,16 @@ class ChartBuilder:
         
         Args:
             full_name: フルネーム
+            decoded: decode_nameの結果（計算済みなら渡すと名前の再走査を省略）
             
         Returns:
             {'number': int, 'is_master': bool,  'vowels': list}
         """
-        vowels, _ = self.core.separate_vowels_consonants(full_name, self.system)
+        if decoded is None:
+            # キャッシュ上のリストを結果に入れるため複製する
+            vowels = list(_decode_name_cached(full_name, self.system).vowels)
+        else:
+            vowels = decoded.vowels
         total = sum(vowels)
         final = self.core.reduce_number(total) if total > 0 else 1
         
@@ -137,7 +180,7 @@ class ChartBuilder:
             'vowels': vowels
         }
     
-    def calc_personality(self, full_name: str) -> Dict:
+    def calc_personality(self, full_name: str, decoded: Optional[NameDecode] = None) -> Dict:
         """
         Personality Number
         
@@ -145,11 +188,16 @@ class ChartBuilder:
         
         Args:
             full_name: フルネーム
+            decoded: decode_nameの結果（計算済みなら渡すと名前の再走査を省略）
             
         Returns:
             {'number': int, 'is_master': bool, 'consonants': list}
         """
-        _, consonants = self.core.separate_vowels_consonants(full_name, self.system)
+        if decoded is None:
+            # キャッシュ上のリストを結果に入れるため複製する
+            consonants = list(_decode_name_cached(full_name, self.system).consonants)
+        else:
+            consonants = decoded.consonants
         total = sum(consonants)
         final = self.core.reduce_number(total) if total > 0 else 1
         
@@ -217,7 +265,28 @@ class ChartBuilder:
         total = month_reduced + day_reduced + year_reduced
         return self.core.reduce_number(total, keep_master=False)
     
-    def calc_pinnacles(self, birth_date: datetime) -> List[Dict]:
+    def calc_personal_year_range(self, birth_date: datetime, start_year: int, end_year: int) -> np.ndarray:
+        """
+        連続する年のPersonal Yearをまとめて計算（年表作成用）
+        
+        誕生月・日の還元は一度だけ行い、年の還元は数根の公式で配列に一括適用する
+        
+        Args:
+            birth_date: 生年月日
+            start_year: 開始年
+            end_year: 終了年（この年を含む）
+            
+        Returns:
+            Personal Year (1-9) の配列（インデックス = 対象年 - start_year）
+        """
+        base = (
+            self.core.reduce_number(birth_date.month, keep_master=False)
+            + self.core.reduce_number(birth_date.day, keep_master=False)
+        )
+        years = np.arange(start_year, end_year + 1, dtype=np.int64)
+        return _digital_root(base + _digital_root(years))
+    
+    def calc_pinnacles(self, birth_date: datetime, life_path: Optional[int] = None) -> List[Dict]:
         """
         4つのピナクル（Pinnacles）を計算
         
@@ -237,6 +306,7 @@ class ChartBuilder:
         
         Args:
             birth_date: 生年月日
+            life_path: ライフパス数（計算済みなら渡すと再計算を省略）
             
         Returns:
             List of {
@@ -251,8 +321,8 @@ class ChartBuilder:
         year = birth_date.year
         
         # ライフパス数を取得（期間計算用）
-        life_path_data = self.calc_life_path(birth_date)
-        life_path = life_path_data['number']
+        if life_path is None:
+            life_path = _life_path_number(year, month, day)
         if life_path in MASTER_NUMBERS:
             # マスターナンバーは基数に還元
             life_path = self.core.reduce_number(life_path, keep_master=False)
@@ -337,6 +407,53 @@ class ChartBuilder:
             {'period': 'Fourth Challenge', 'number': challenge_4}
         ]
     
+    def calc_cycles_batch(self, birth_dates: Iterable[datetime]) -> Dict[str, np.ndarray]:
+        """
+        複数の生年月日のピナクル・チャレンジをまとめて計算（大量鑑定用）
+        
+        calc_pinnacles / calc_challenges と同じ数値を配列で返す
+        
+        Args:
+            birth_dates: 生年月日の列
+            
+        Returns:
+            配列の辞書:
+                pinnacles: (n, 4) ピナクル1-4
+                challenges: (n, 4) チャレンジ1-4
+                first_pinnacle_end: (n,) 第1ピナクルの終了年齢
+        """
+        birth_dates = list(birth_dates)
+        n = len(birth_dates)
+        months = np.fromiter((d.month for d in birth_dates), dtype=np.int64, count=n)
+        days = np.fromiter((d.day for d in birth_dates), dtype=np.int64, count=n)
+        years = np.fromiter((d.year for d in birth_dates), dtype=np.int64, count=n)
+        
+        if NUMBA_AVAILABLE:
+            cycles = cycle_numbers(months, days, years)
+            pinnacles = cycles[:, 0:4]
+            challenges = cycles[:, 4:8]
+            first_end = cycles[:, 8]
+        else:
+            month_r = _digital_root(months)
+            day_r = _digital_root(days)
+            year_r = _digital_root(years)
+            
+            p1 = _digital_root(month_r + day_r)
+            p2 = _digital_root(day_r + year_r)
+            pinnacles = np.stack([p1, p2, _digital_root(p1 + p2), _digital_root(month_r + year_r)], axis=1)
+            
+            c1 = np.abs(month_r - day_r)
+            c2 = np.abs(day_r - year_r)
+            challenges = np.stack([c1, c2, np.abs(c1 - c2), np.abs(month_r - year_r)], axis=1)
+            
+            first_end = 36 - _digital_root(month_r + day_r + year_r)
+        
+        return {
+            'pinnacles': pinnacles,
+            'challenges': challenges,
+            'first_pinnacle_end': first_end
+        }
+    
     # ============================================
     # Grid Matrix
     # ============================================
@@ -344,7 +461,8 @@ class ChartBuilder:
     def calc_grid_matrix(
         self, 
         birth_date: datetime, 
-        full_name: str
+        full_name: str,
+        decoded: Optional[NameDecode] = None
     ) -> Dict[int, int]:
         """
         1-9の出現頻度マトリックス
@@ -354,27 +472,26 @@ class ChartBuilder:
         Args:
             birth_date: 生年月日
             full_name: フルネーム
+            decoded: decode_nameの結果（計算済みなら渡すと名前の再走査を省略）
             
         Returns:
             {1: count, 2: count, ..., 9: count}
         """
-        # 初期化
-        grid = {i: 0 for i in range(1, 10)}
+        # 数字ごとの出現回数（インデックス = 数字、0は集計対象外）
+        counts = [0] * 10
         
-        # 生年月日から
-        date_str = birth_date.strftime('%Y%m%d')
-        for digit in date_str:
-            num = int(digit)
-            if 1 <= num <= 9:
-                grid[num] += 1
+        # 生年月日から（ASCII数字のバイト値 - 48 = 数字）
+        for byte in birth_date.strftime('%Y%m%d').encode('ascii'):
+            counts[byte - 48] += 1
         
         # 名前から
-        name_numbers = self.core.text_to_number(full_name, self.system)
-        for num in name_numbers:
+        if decoded is None:
+            decoded = _decode_name_cached(full_name, self.system)
+        for num in decoded.values:
             if 1 <= num <= 9:
-                grid[num] += 1
+                counts[num] += 1
         
-        return grid
+        return {i: counts[i] for i in range(1, 10)}
 
 
 class AstroWeighting:
@@ -443,19 +560,14 @@ class AstroWeighting:
             # 逆行判定（速度が負）
             is_retrograde = speed < 0
             
-            # 品位評価
-            dignity = self._assess_dignity(planet_name, sign_name)
-            
-            # スコア計算
-            strength = 1.0
-            if dignity == 'Domicile':
-                strength = 1.2
-            elif dignity == 'Exaltation':
-                strength = 1.1
-            elif dignity == 'Detriment':
-                strength = 0.8
-            elif dignity == 'Fall':
-                strength = 0.7
+            # 品位評価とスコア計算
+            code = DIGNITY_TABLE.get((planet_name, sign_name))
+            if code is None:
+                dignity = None
+                strength = 1.0
+            else:
+                dignity = DIGNITY_NAMES[code]
+                strength = _DIGNITY_STRENGTH[code]
             
             if is_retrograde:
                 strength *= 0.9
@@ -484,33 +596,13 @@ class AstroWeighting:
         Returns:
             'Domicile' / 'Exaltation' / 'Detriment' / 'Fall' / None
         """
-        # Domicile（本来の座）
-        if sign_name in DOMICILE.get(planet_name, []):
-            return 'Domicile'
-        
-        # Exaltation（高揚）
-        if sign_name == EXALTATION.get(planet_name):
-            return 'Exaltation'
-        
-        # Detriment（障害）
-        if sign_name in DETRIMENT.get(planet_name, []):
-            return 'Detriment'
-        
-        # Fall（下降）
-        if sign_name == FALL.get(planet_name):
-            return 'Fall'
-        
-        return None
+        code = DIGNITY_TABLE.get((planet_name, sign_name))
+        return DIGNITY_NAMES[code] if code is not None else None
     
     def _dummy_planet_status(self) -> Dict:
         """
         pyswissephが利用できない場合のダミーステータス
+        
+        毎回同じ共有の辞書を返すため、呼び出し側で書き換えないこと（必要ならdict()で複製）
         """
-        return {
-            'sign': 'Unknown',
-            'sign_ja': '不明',
-            'degree': 0.0,
-            'is_retrograde': False,
-            'dignity': None,
-            'strength_score': 1.0
-        }
+        return _DUMMY_PLANET_STATUS
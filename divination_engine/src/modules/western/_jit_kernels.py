@@ -0,0 +1,38 @@
+"""
+西洋占星術の数値カーネル
+Western astrology numeric kernels
+
+ボイドタイムの月と惑星のアスペクト判定をまとめた純粋な算術関数。
+numbaがインストールされていれば@njitでコンパイルし、
+なければ通常のPython関数として動作する（呼び出し側はNUMBA_AVAILABLEで経路を選ぶ）。
+"""
+
+import numpy as np
+
+from ...core.jit import njit
+
+
+@njit(cache=True)
+def major_aspect_kinds(
+    moon_lon: float,
+    planet_lons: np.ndarray,
+    angles: np.ndarray,
+    orb: float
+) -> np.ndarray:
+    """
+    月と各惑星の間のメジャーアスペクト判定（VoidOfCourseCalculator._major_aspect_kindsの本体）
+
+    Returns:
+        惑星ごとのアスペクトのインデックス（anglesの順、なしは-1）
+    """
+    n = planet_lons.shape[0]
+    kinds = np.full(n, -1, dtype=np.int64)
+    for i in range(n):
+        diff = abs(planet_lons[i] - moon_lon)
+        if diff > 180:
+            diff = 360 - diff
+        for k in range(angles.shape[0]):
+            if abs(diff - angles[k]) <= orb:
+                kinds[i] = k
+                break
+    return kinds
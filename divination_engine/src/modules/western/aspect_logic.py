@@ -1,115 +1,158 @@
 from typing import List, Dict, Any, Tuple
+
+import numpy as np
+
 from ...const.astro_const import AspectType, ASPECT_ANGLES, DEFAULT_ORBS
 
+# ルミナリー（太陽・月）
+_LUMINARIES = frozenset({'Sun', 'Moon'})
+
+# AspectEngine.calculate_aspects_arrayの戻り値の要素型
+ASPECT_RECORD_DTYPE = np.dtype([
+    ('body_a', np.int32),        # 天体aのインデックス（bodies内）
+    ('body_b', np.int32),        # 天体bのインデックス（bodies内）
+    ('aspect', np.int8),         # アスペクトのインデックス（ASPECT_ANGLESの定義順）
+    ('actual_angle', np.float64),  # 実測角度
+    ('orb', np.float64),         # 誤差
+    ('applying', np.bool_)       # Applying（形成中）か
+])
+
 class AspectEngine:
     """
     アスペクト計算エンジン
     """
     
+    # アスペクト定義（判定順の並列配列）。定数から決まるためクラスで一度だけ用意する
+    _aspect_types = tuple(ASPECT_ANGLES.keys())
+    _aspect_angles = tuple(ASPECT_ANGLES.values())
+    _angles = np.asarray(_aspect_angles, dtype=np.float64)
+    
     def __init__(self, orbs: Dict[Tuple[AspectType, bool], float] = DEFAULT_ORBS):
         """
         Args:
             orbs: (AspectType, is_luminary) -> orb_deg の辞書
         """
         self.orbs = orbs
+        
+        # オーブ上限（インデックス = is_luminary）
+        self._orb_limits = (
+            tuple(self._get_orb(t, False) for t in self._aspect_types),
+            tuple(self._get_orb(t, True) for t in self._aspect_types)
+        )
+        self._orb_lum = np.asarray(self._orb_limits[True], dtype=np.float64)
+        self._orb_nolum = np.asarray(self._orb_limits[False], dtype=np.float64)
+        # (2, アスペクト数) のオーブ上限表（行 = is_luminary）
+        self._orb_table = np.stack((self._orb_nolum, self._orb_lum))
 
     def _get_orb(self, aspect_type: AspectType, is_luminary: bool) -> float:
         return self.orbs.get((aspect_type, is_luminary), 1.0) # デフォルト1度
 
-    def calculate_aspects(self, bodies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def calculate_aspects(self, bodies: List[Dict[str, Any]], rounded: bool = True) -> List[Dict[str, Any]]:
         """
         天体リストから全アスペクトを計算
         
         bodies: [{id, longitude, speed_long, ...}, ...]
+        rounded: Falseの場合はorbを丸めずにそのまま出力（内部計算で続けて使う場合）
         """
-        aspects = []
-        n = len(bodies)
+        if len(bodies) < 2:
+            return []
+        idx_a, idx_b, kinds, diff, orbs, applying = self._scan(bodies)
         
-        for i in range(n):
-            for j in range(i + 1, n):
-                body_a = bodies[i]
-                body_b = bodies[j]
-                
-                # 自分自身とのアスペクトは除外（念のため）
-                if body_a['id'] == body_b['id']:
-                    continue
-                    
-                res = self._check_aspect(body_a, body_b)
-                if res:
-                    aspects.append(res)
+        # 要素アクセスはPythonのリストで行う（NumPyスカラーの生成を避ける）
+        aspects = []
+        for i, j, k, actual, orb, is_applying in zip(
+            idx_a.tolist(), idx_b.tolist(), kinds.tolist(),
+            diff.tolist(), orbs.tolist(), applying.tolist()
+        ):
+            body_a = bodies[i]
+            body_b = bodies[j]
+            
+            # 自分自身とのアスペクトは除外（念のため）
+            if body_a['id'] == body_b['id']:
+                continue
+            
+            aspects.append({
+                "body_a": body_a['id'],
+                "body_b": body_b['id'],
+                "type": self._aspect_types[k],
+                "angle": self._aspect_angles[k],
+                "actual_angle": actual,
+                "orb": round(orb, 4) if rounded else orb,
+                "state": "Applying" if is_applying else "Separating"
+            })
                     
         return aspects
 
-    def _check_aspect(self, body_a: Dict[str, Any], body_b: Dict[str, Any]) -> Dict[str, Any]:
+    def calculate_aspects_array(self, bodies: List[Dict[str, Any]]) -> np.ndarray:
         """
-        2天体間のアスペクト判定
+        天体リストから全アスペクトを計算（構造化配列で返す）
+        
+        calculate_aspectsと同じ判定結果を、アスペクトごとの辞書を作らずに
+        ASPECT_RECORD_DTYPEの1次元配列として返す（内部で続けて配列演算する場合用）。
+        body_a / body_b はbodiesのインデックス、aspectはASPECT_ANGLESの定義順のインデックス。
+        orbは丸めない。
         """
-        long_a = body_a['longitude']
-        long_b = body_b['longitude']
+        if len(bodies) < 2:
+            return np.empty(0, dtype=ASPECT_RECORD_DTYPE)
+        idx_a, idx_b, kinds, diff, orbs, applying = self._scan(bodies)
         
-        # 角度差 (0-180)
-        diff = abs(long_a - long_b)
-        if diff > 180:
-            diff = 360 - diff
-            
-        # ルミナリー（太陽・月）が含まれるか？
-        is_luminary = (body_a['id'] in ['Sun', 'Moon']) or (body_b['id'] in ['Sun', 'Moon'])
+        records = np.empty(kinds.size, dtype=ASPECT_RECORD_DTYPE)
+        records['body_a'] = idx_a
+        records['body_b'] = idx_b
+        records['aspect'] = kinds
+        records['actual_angle'] = diff
+        records['orb'] = orbs
+        records['applying'] = applying
         
-        # 全アスペクト定義をチェック
-        for aspect_type, angle in ASPECT_ANGLES.items():
-            orb_limit = self._get_orb(aspect_type, is_luminary)
-            
-            # オーブ内か？
-            current_orb = abs(diff - angle)
-            if current_orb <= orb_limit:
-                # 状態判定 (Applying/Separating)
-                state = self._determine_state(body_a, body_b, angle, diff)
-                
-                return {
-                    "body_a": body_a['id'],
-                    "body_b": body_b['id'],
-                    "type": aspect_type,
-                    "angle": angle, # 定義上の角度 (120 etc)
-                    "actual_angle": diff, # 実測角度
-                    "orb": round(current_orb, 4),      # 誤差
-                    "state": state
-                }
-                
-        return None
+        # 自分自身とのアスペクトは除外（念のため。IDが重複するときだけ判定する）
+        ids = [b['id'] for b in bodies]
+        if len(set(ids)) < len(ids):
+            same = np.fromiter(
+                (ids[i] == ids[j] for i, j in zip(idx_a.tolist(), idx_b.tolist())),
+                dtype=bool, count=kinds.size
+            )
+            records = records[~same]
+        return records
 
-    def _determine_state(self, body_a: Dict[str, Any], body_b: Dict[str, Any], aspect_angle: float, current_diff: float) -> str:
+    def _scan(self, bodies: List[Dict[str, Any]]) -> Tuple[np.ndarray, ...]:
         """
-        Applying (形成中) か Separating (分離中) かを判定
+        全ペア（i < j）を走査し、アスペクトを形成するペアだけの配列を返す
         
-        Logic:
-        1. 速い天体と遅い天体を特定
-        2. 相対速度を計算
-        3. 角度差が「これから定義角(strict)に近づく」ならApplying
+        Returns:
+            (天体aのインデックス, 天体bのインデックス, アスペクトのインデックス, 角度差, 誤差, Applyingか)
         """
-        speed_a = body_a['speed_long']
-        speed_b = body_b['speed_long']
-        pos_a = body_a['longitude']
-        pos_b = body_b['longitude']
+        n = len(bodies)
         
-        # 相対的な動きを見るために、Bを静止させてAの相対速度を見るアプローチ
-        # しかし、円環上なので「差分が縮まる方向か」を見るのが確実
+        # 角度差とオーブ判定を全ペア分まとめて計算
+        longitudes = np.fromiter((b['longitude'] for b in bodies), dtype=np.float64, count=n)
+        speeds = np.fromiter((b['speed_long'] for b in bodies), dtype=np.float64, count=n)
+        is_luminary = np.fromiter((b['id'] in _LUMINARIES for b in bodies), dtype=bool, count=n)
+        idx_a, idx_b = np.triu_indices(n, 1)
         
-        # 現在の誤差
-        orb_now = abs(current_diff - aspect_angle)
+        # 角度差 (0-180)：比較マスクを作らずに小さい方の弧を取る
+        # （符号付きの差は状態判定でも使うため一度だけ求める）
+        delta = longitudes[idx_a] - longitudes[idx_b]
+        diff = np.abs(delta)
+        diff = np.minimum(diff, 360 - diff)
         
-        # 未来（例えば1時間後 = 1/24日後）の位置で誤差を再計算
-        dt = 1.0 / 24.0
+        # ペアごとのオーブ上限（ルミナリーを含むかで表の行を引く）と各アスペクトとの誤差
+        # （誤差は連続したfloat64の (ペア数, アスペクト数) 配列上でその場で絶対値を取る）
+        orb_limit = self._orb_table[(is_luminary[idx_a] | is_luminary[idx_b]).astype(np.intp)]
+        current_orb = diff[:, None] - self._angles
+        np.abs(current_orb, out=current_orb)
+        within = current_orb <= orb_limit
         
-        future_pos_a = (pos_a + speed_a * dt) % 360
-        future_pos_b = (pos_b + speed_b * dt) % 360
+        # オーブ内のアスペクトがあるペアだけを取り出し、定義順で最初のアスペクトを採用
+        hits = np.flatnonzero(within.any(axis=1))
+        kinds = within[hits].argmax(axis=1)
+        orbs = current_orb[hits, kinds]
+        diff = diff[hits]
         
-        future_diff = abs(future_pos_a - future_pos_b)
-        if future_diff > 180:
-            future_diff = 360 - future_diff
-            
-        orb_future = abs(future_diff - aspect_angle)
+        # 状態判定 (Applying/Separating) を該当ペア分まとめて計算
+        # 符号付きの最短角度差 gap (-180〜180) について、角度差 |gap| の時間変化は
+        # sign(gap) * (speed_a - speed_b)。誤差 |角度差 - 定義角| が縮む（時間微分が負）ならApplying
+        gap = (delta[hits] + 180.0) % 360.0 - 180.0
+        rate = (diff - self._angles[kinds]) * gap * (speeds[idx_a[hits]] - speeds[idx_b[hits]])
+        applying = rate < 0
         
-        if orb_future < orb_now:
-            return "Applying"
-        else:
-            return "Separating"
+        return idx_a[hits], idx_b[hits], kinds, diff, orbs, applying
@@ -1,9 +1,132 @@
 import swisseph as swe
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Sequence, Tuple
+import math
 import os
 
-from ...const.astro_const import PlanetId
+import numpy as np
+
+from ...const.astro_const import PlanetId, SIGNS_JP
+from ...core.jit import NUMBA_AVAILABLE
+from ._jit_kernels import major_aspect_kinds
+
+# calculate_bodyの戻り値の数値項目（キャッシュ上のタプルの並び順）
+_BODY_FIELDS = ("longitude", "latitude", "distance", "speed_long", "declination", "right_ascension")
+
+
+@lru_cache(maxsize=1024)
+def _true_obliquity(julian_day: float) -> float:
+    """真の黄道傾斜角（章動込み、度）"""
+    return swe.calc_ut(julian_day, swe.ECL_NUT, 0)[0][0]
+
+
+# 最後にswe.set_topoで設定した観測地点 (lon, lat, alt)（swe.set_topoはこのモジュールからのみ呼ぶ）
+_last_topo: Optional[Tuple[float, float, float]] = None
+
+
+@lru_cache(maxsize=8192)
+def _calculate_body_cached(
+    julian_day: float,
+    body_id: int,
+    lat: float,
+    lon: float,
+    alt: float,
+    topocentric: bool
+) -> Tuple[float, float, float, float, float, float, Optional[str]]:
+    """
+    天体位置を計算（AstroCore.calculate_bodyの実体）
+    
+    同じ時刻・天体・観測地点の組は結果を再利用する。
+    キーのユリウス日は丸めない（秒単位などに量子化すると、別の時刻の位置を返すことになるため）。
+    キャッシュには辞書ではなく不変のタプル（_BODY_FIELDSの順の数値 + エラー文字列またはNone）を保持する。
+    エフェメリスパスを変更したらcache_clear()で破棄する（AstroCore.__init__で実施）。
+    """
+    # フラグ設定
+    # SEFLG_SPEED: 速度計算を含める
+    # SEFLG_SWIEPH: Swiss Ephemeris計算を使用
+    flags = swe.FLG_SPEED | swe.FLG_SWIEPH
+    
+    if topocentric:
+        # トポセントリック計算（観測地点が前回と同じならswisseph側の再設定を省く）
+        global _last_topo
+        topo = (lon, lat, alt)
+        if topo != _last_topo:
+            swe.set_topo(lon, lat, alt)
+            _last_topo = topo
+        flags |= swe.FLG_TOPOCTR
+    else:
+        # ジオセントリック（デフォルト）
+        pass
+    
+    # 計算実行 (黄道座標)
+    try:
+        # longitude, latitude, distance, speed_long, speed_lat, speed_dist
+        res = swe.calc_ut(julian_day, body_id, flags)
+        xx = res[0]
+    
+        # 赤道座標は黄道座標を真の黄道傾斜角で座標変換して求める（赤道座標用のcalc_utを省略）
+        xx_eq = swe.cotrans((xx[0], xx[1], 1.0), -_true_obliquity(julian_day))
+    
+        return (xx[0], xx[1], xx[2], xx[3], xx_eq[1], xx_eq[0], None)
+    
+    except swe.Error as e:
+        # エラー処理: ファイルがない場合など
+        err_msg = str(e)
+        if "SwissEph file" in err_msg and "not found" in err_msg:
+            # Moshier Ephemerisで再試行 (FLG_SWIEPHを外す)
+            if body_id < swe.CHIRON: # 主要惑星のみ
+                flags &= ~swe.FLG_SWIEPH
+                try:
+                    res = swe.calc_ut(julian_day, body_id, flags)
+                    xx = res[0]
+                    # 赤道座標は通常時と同じく黄道座標の座標変換で求める
+                    xx_eq = swe.cotrans((xx[0], xx[1], 1.0), -_true_obliquity(julian_day))
+                    return (xx[0], xx[1], xx[2], xx[3], xx_eq[1], xx_eq[0], None)
+                except swe.Error:
+                    pass
+    
+        # それでもダメなら(小惑星など)、ダミーデータを返すか例外
+        # ここでは処理継続のためダミーデータを返し、警告を出す
+        print(f"Warning: Calculation failed for body {body_id}. {e}")
+        return (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, str(e))
+
+
+def _body_columns(matrix: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    (..., 6) の天体位置行列を項目ごとの配列（ビュー）に分け、逆行・サイン情報を加える
+    """
+    columns = dict(zip(_BODY_FIELDS, np.moveaxis(matrix, -1, 0)))
+    sign_index, sign_degree = np.divmod(columns["longitude"], 30.0)
+    columns["is_retrograde"] = columns["speed_long"] < 0
+    columns["sign_index"] = sign_index.astype(np.int32)
+    columns["sign_degree"] = sign_degree
+    return columns
+
+
+# 既定のエフェメリスディレクトリ（src/data/ephe）
+_DEFAULT_EPHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'data', 'ephe'
+)
+
+# _calculate_body_cachedの結果を計算したエフェメリスパス
+_cached_ephe_path: Optional[str] = None
+
+
+def _set_ephe_path(path: str) -> None:
+    """
+    エフェメリスパスを設定
+    
+    エフェメリスが変わると計算結果も変わるため、前回と異なるパスの場合のみ過去の計算結果を破棄する
+    （同じパスでAstroCoreを作り直してもキャッシュは維持される）
+    """
+    global _cached_ephe_path
+    # swisseph側の設定は他モジュールが変更している可能性があるため毎回行う
+    swe.set_ephe_path(path)
+    if path != _cached_ephe_path:
+        _calculate_body_cached.cache_clear()
+        _cached_ephe_path = path
+
 
 class AstroCore:
     """
@@ -21,13 +144,11 @@ class AstroCore:
         """
         # エフェメリスパスの設定
         if ephe_path:
-            swe.set_ephe_path(ephe_path)
+            _set_ephe_path(ephe_path)
         else:
             # 一般的なパスを試行
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            data_dir = os.path.join(base_dir, 'data', 'ephe')
-            if os.path.exists(data_dir):
-                swe.set_ephe_path(data_dir)
+            if os.path.exists(_DEFAULT_EPHE_DIR):
+                _set_ephe_path(_DEFAULT_EPHE_DIR)
             # なければシステムのデフォルトまたは環境変数に依存
             
     def get_julian_day(self, dt: datetime) -> float:
@@ -76,75 +197,81 @@ class AstroCore:
                 "is_retrograde": 逆行フラグ
             }
         """
-        # フラグ設定
-        # SEFLG_SPEED: 速度計算を含める
-        # SEFLG_SWIEPH: Swiss Ephemeris計算を使用
-        flags = swe.FLG_SPEED | swe.FLG_SWIEPH
+        if not topocentric:
+            # ジオセントリックでは観測地点を使わないため、地点違いでもキャッシュを共有する
+            lat = lon = alt = 0.0
         
-        if topocentric:
-            # トポセントリック計算
-            swe.set_topo(lon, lat, alt)
-            flags |= swe.FLG_TOPOCTR
-        else:
-            # ジオセントリック（デフォルト）
-            pass
-            
-        # 計算実行 (黄道座標)
-        try:
-            # longitude, latitude, distance, speed_long, speed_lat, speed_dist
-            res = swe.calc_ut(julian_day, body_id, flags)
-            xx = res[0]
-            
-            # 赤道座標も計算
-            flags_eq = flags | swe.FLG_EQUATORIAL
-            try:
-                res_eq = swe.calc_ut(julian_day, body_id, flags_eq)
-                xx_eq = res_eq[0]
-            except swe.Error:
-                # 赤道座標だけ失敗することは稀だが、フォールバックとして0を入れるか
-                xx_eq = [0.0, 0.0]
+        raw = _calculate_body_cached(julian_day, body_id, lat, lon, alt, topocentric)
+        data = dict(zip(_BODY_FIELDS, raw))
+        data["is_retrograde"] = raw[3] < 0
+        if raw[6] is not None:
+            data["error"] = raw[6]
+        return data
 
-            return {
-                "longitude": xx[0],
-                "latitude": xx[1],
-                "distance": xx[2],
-                "speed_long": xx[3],
-                "declination": xx_eq[1],     
-                "right_ascension": xx_eq[0], 
-                "is_retrograde": xx[3] < 0
-            }
-            
-        except swe.Error as e:
-            # エラー処理: ファイルがない場合など
-            err_msg = str(e)
-            if "SwissEph file" in err_msg and "not found" in err_msg:
-                # Moshier Ephemerisで再試行 (FLG_SWIEPHを外す)
-                if body_id < swe.CHIRON: # 主要惑星のみ
-                    flags &= ~swe.FLG_SWIEPH
-                    try:
-                        res = swe.calc_ut(julian_day, body_id, flags)
-                        xx = res[0]
-                        return {
-                            "longitude": xx[0],
-                            "latitude": xx[1],
-                            "distance": xx[2],
-                            "speed_long": xx[3],
-                            "declination": 0.0, # 簡易
-                            "right_ascension": 0.0,
-                            "is_retrograde": xx[3] < 0
-                        }
-                    except swe.Error:
-                        pass
-            
-            # それでもダメなら(小惑星など)、ダミーデータを返すか例外
-            # ここでは処理継続のためダミーデータを返し、警告を出す
-            print(f"Warning: Calculation failed for body {body_id}. {e}")
-            return {
-                "longitude": 0.0, "latitude": 0.0, "distance": 0.0, 
-                "speed_long": 0.0, "declination": 0.0, "right_ascension": 0.0,
-                "is_retrograde": False,
-                "error": str(e)
+    def calculate_bodies(
+        self,
+        julian_day: float,
+        body_ids: Sequence[int],
+        lat: float = 0.0,
+        lon: float = 0.0,
+        alt: float = 0.0,
+        topocentric: bool = False
+    ) -> Dict[str, np.ndarray]:
+        """
+        複数天体の位置をまとめて計算（項目ごとの配列で返す）
+        
+        天体ごとの辞書ではなく項目ごとのfloat64配列にまとめるため、
+        アスペクト・ハウス判定などを配列演算で続けて処理できる。
+        各天体の計算（フォールバック含む）はcalculate_bodyと同じ。
+        
+        Returns:
+            {
+                "longitude", "latitude", "distance", "speed_long",
+                "declination", "right_ascension": float64配列（body_idsの順）,
+                "is_retrograde": bool配列,
+                "sign_index": サインのインデックス (0-11) のint32配列,
+                "sign_degree": サイン内の度数 (0-30)
             }
+        """
+        if not topocentric:
+            lat = lon = alt = 0.0
+        
+        # キャッシュ上のタプルから辞書を作らずに (N, 6) の行列へまとめ、列ごとのビューを返す
+        matrix = np.array(
+            [_calculate_body_cached(julian_day, body_id, lat, lon, alt, topocentric)[:6] for body_id in body_ids],
+            dtype=np.float64
+        ).reshape(len(body_ids), len(_BODY_FIELDS))
+        return _body_columns(matrix)
+
+    def calculate_bodies_series(
+        self,
+        julian_days: Sequence[float],
+        body_ids: Sequence[int],
+        lat: float = 0.0,
+        lon: float = 0.0,
+        alt: float = 0.0,
+        topocentric: bool = False
+    ) -> Dict[str, np.ndarray]:
+        """
+        複数時刻 × 複数天体の位置をまとめて計算（1年分のトランジット表など）
+        
+        calculate_bodiesと同じ項目を (時刻数, 天体数) の配列で返す。
+        pyswissephは計算中もGILを保持し、Swiss Ephemerisの状態もプロセス全体で共有されるため、
+        スレッドでは並列化せずに順に計算する。
+        時刻ごとに一度しか使わない結果でチャート用のキャッシュを押し出さないよう、キャッシュは経由しない。
+        """
+        if not topocentric:
+            lat = lon = alt = 0.0
+        
+        calculate = _calculate_body_cached.__wrapped__
+        matrix = np.array(
+            [
+                [calculate(julian_day, body_id, lat, lon, alt, topocentric)[:6] for body_id in body_ids]
+                for julian_day in julian_days
+            ],
+            dtype=np.float64
+        ).reshape(len(julian_days), len(body_ids), len(_BODY_FIELDS))
+        return _body_columns(matrix)
 
     def get_node_position(self, julian_day: float, mean_mode: bool = True) -> Dict[str, float]:
         """
@@ -180,20 +307,28 @@ class VoidOfCourseCalculator:
     """
     
     # メジャーアスペクト角度（ボイド判定に使用）
-    MAJOR_ASPECTS = [0, 60, 90, 120, 180]  # conjunction, sextile, square, trine, opposition
+    # （_MAJOR_ANGLES・_MAJOR_ASPECT_NAMESと対応するため、変更できないタプルにする）
+    MAJOR_ASPECTS = (0, 60, 90, 120, 180)  # conjunction, sextile, square, trine, opposition
+    
+    _MAJOR_ANGLES = np.array(MAJOR_ASPECTS, dtype=np.float64)
+    # MAJOR_ASPECTSと同じ順のアスペクト名
+    _MAJOR_ASPECT_NAMES = ("Conjunction", "Sextile", "Square", "Trine", "Opposition")
+    # 月 - 惑星の相対黄経 (0-360) で見たアスペクトの位置
+    _RELATIVE_TARGETS = np.array([0, 60, 90, 120, 180, 240, 270, 300, 360], dtype=np.float64)
     
     # メジャーアスペクトのオーブ（度）
     MAJOR_ASPECT_ORB = 8.0
     
     # チェック対象惑星
-    PLANETS_FOR_VOC = [
+    PLANETS_FOR_VOC = (
         PlanetId.SUN, PlanetId.MERCURY, PlanetId.VENUS, PlanetId.MARS,
         PlanetId.JUPITER, PlanetId.SATURN, PlanetId.URANUS, 
         PlanetId.NEPTUNE, PlanetId.PLUTO
-    ]
+    )
     
     def __init__(self, core: AstroCore = None):
-        self.core = core or AstroCore()
+        # 未指定ならモジュール共有のAstroCoreを使う（エフェメリス設定をやり直さない）
+        self.core = core or default_core
     
     def calculate_void_of_course(
         self,
@@ -241,17 +376,36 @@ class VoidOfCourseCalculator:
         sign_change_jd = julian_day + days_to_next_sign
         
         # 他の惑星の位置を取得
-        planets_data = {}
-        for planet_id in self.PLANETS_FOR_VOC:
-            planets_data[planet_id] = self.core.calculate_body(julian_day, planet_id, lat, lon, alt)
+        planets_data = self.core.calculate_bodies(julian_day, self.PLANETS_FOR_VOC, lat, lon, alt)
         
         # 現在から次のサイン境界までにアスペクトを形成するか検索
         last_aspect = None
         next_aspect_before_sign_change = None
         
+        # 現在のアスペクト（複数あれば最後の惑星）
+        kinds = self._major_aspect_kinds(moon_lon, planets_data['longitude'])
+        hits = np.flatnonzero(kinds >= 0)
+        if hits.size:
+            last_aspect = self._aspect_event(hits[-1], kinds, julian_day)
+        
         # 時間ステップ（1時間 = 1/24日）で検索
         step = 1.0 / 24.0
-        check_jd = julian_day
+        check_jd = sign_change_jd
+        
+        # 1ステップ後の位置は線形外挿で判定する（オーブ・サイン境界に近い場合を除く）
+        moon_next = moon_lon + moon_speed * step
+        planet_next = planets_data['longitude'] + planets_data['speed_long'] * step
+        kinds = self._extrapolated_kinds(moon_next, planet_next, current_sign_idx)
+        hits = np.flatnonzero(kinds >= 0) if kinds is not None else ()
+        if len(hits) and julian_day + step < sign_change_jd:
+            next_aspect_before_sign_change = self._aspect_event(hits[0], kinds, julian_day + step)
+        else:
+            # 次にオーブに入る時刻を解析的に見積もり、その直前のステップから確認する
+            first_step = self._estimate_next_aspect_step(
+                julian_day, moon_lon, moon_speed, planets_data, days_to_next_sign, step
+            )
+            if first_step is not None:
+                check_jd = julian_day + first_step * step
         
         while check_jd < sign_change_jd:
             moon_check = self.core.calculate_body(check_jd, PlanetId.MOON, lat, lon, alt)
@@ -261,30 +415,12 @@ class VoidOfCourseCalculator:
             if int(moon_check_lon // 30) != current_sign_idx:
                 break
             
-            for planet_id in self.PLANETS_FOR_VOC:
-                planet_check = self.core.calculate_body(check_jd, planet_id, lat, lon, alt)
-                planet_lon = planet_check['longitude']
-                
-                # アスペクトチェック
-                aspect = self._check_major_aspect(moon_check_lon, planet_lon)
-                if aspect:
-                    if check_jd <= julian_day:
-                        # 過去または現在のアスペクト
-                        last_aspect = {
-                            "planet": planet_id.name,
-                            "aspect_type": aspect,
-                            "time_jd": check_jd
-                        }
-                    else:
-                        # 未来のアスペクト（サイン変更前）
-                        next_aspect_before_sign_change = {
-                            "planet": planet_id.name,
-                            "aspect_type": aspect,
-                            "time_jd": check_jd
-                        }
-                        break
-            
-            if next_aspect_before_sign_change:
+            # 全惑星とのアスペクトを配列演算でまとめて判定し、形成している最初の惑星を採用（サイン変更前）
+            planet_lons = self.core.calculate_bodies(check_jd, self.PLANETS_FOR_VOC, lat, lon, alt)['longitude']
+            kinds = self._major_aspect_kinds(moon_check_lon, planet_lons)
+            hits = np.flatnonzero(kinds >= 0)
+            if hits.size:
+                next_aspect_before_sign_change = self._aspect_event(hits[0], kinds, check_jd)
                 break
                 
             check_jd += step
@@ -292,14 +428,9 @@ class VoidOfCourseCalculator:
         # ボイド判定
         is_void = (next_aspect_before_sign_change is None)
         
-        # サイン名
-        sign_names = [
-            "牡羊座", "牡牛座", "双子座", "蟹座",
-            "獅子座", "乙女座", "天秤座", "蠍座",
-            "射手座", "山羊座", "水瓶座", "魚座"
-        ]
-        current_sign = sign_names[current_sign_idx]
-        next_sign = sign_names[(current_sign_idx + 1) % 12]
+        # サイン名（定数の表を参照し、呼び出しごとにリストを作らない）
+        current_sign = SIGNS_JP[current_sign_idx]
+        next_sign = SIGNS_JP[(current_sign_idx + 1) % 12]
         
         # 説明文
         if is_void:
@@ -321,6 +452,104 @@ class VoidOfCourseCalculator:
             "warning": "契約・重要決断は避けることを推奨" if is_void else None
         }
     
+    def _extrapolated_kinds(
+        self,
+        moon_lon: float,
+        planet_lons: np.ndarray,
+        current_sign_idx: int,
+        tolerance: float = 0.01
+    ) -> Optional[np.ndarray]:
+        """
+        線形外挿した位置で各惑星とのメジャーアスペクトを判定（_major_aspect_kindsと同じ形式）
+        
+        1時間の外挿誤差は0.001度程度のため、月がサイン内に留まり、
+        全惑星がオーブの境界からtolerance度以上離れている場合だけ結果を返す（それ以外はNone）
+        """
+        if moon_lon >= 360 or int(moon_lon // 30) != current_sign_idx or moon_lon % 30 > 30 - tolerance:
+            return None
+        diff = np.abs(planet_lons % 360 - moon_lon)
+        diff = np.minimum(diff, 360 - diff)
+        margin = np.abs(diff[:, None] - self._MAJOR_ANGLES) - self.MAJOR_ASPECT_ORB
+        if (np.abs(margin) < tolerance).any():
+            return None
+        within = margin <= 0
+        return np.where(within.any(axis=1), within.argmax(axis=1), -1)
+    
+    def _estimate_next_aspect_step(
+        self,
+        julian_day: float,
+        moon_lon: float,
+        moon_speed: float,
+        planets_data: Dict[str, np.ndarray],
+        days_limit: float,
+        step: float
+    ) -> Optional[int]:
+        """
+        月がいずれかの惑星とのメジャーアスペクトのオーブに次に入る時刻を見積もる
+        
+        1. 月と各惑星の相対黄経を相対速度で線形に進め、次のオーブの入口に達する時刻を解く
+        2. その時刻の実際の位置でニュートン法により1回補正する（月の速度変化による誤差を除く）
+        
+        Returns:
+            確認を始める時間ステップ番号（見積もり時刻の1つ前、1以上）。
+            サイン変更までにオーブに入らなければNone
+        """
+        orb = self.MAJOR_ASPECT_ORB
+        rel_speed = moon_speed - planets_data['speed_long']
+        if not (rel_speed > 0).all():
+            # 月が惑星より遅い（通常は起こらない）場合は見積もらずに最初から確認する
+            return 1
+        
+        # 1ステップ後の相対黄経 (0-360) と、その時点で既にオーブ内か
+        rel = (moon_lon - planets_data['longitude'] + rel_speed * step) % 360
+        if (np.abs(rel[:, None] - self._RELATIVE_TARGETS) <= orb).any():
+            return 1
+        
+        # 次のオーブの入口（相対黄経）までの時間
+        ahead = (self._RELATIVE_TARGETS - orb) - rel[:, None]
+        ahead[ahead <= 0] = np.inf
+        entry = ahead.argmin(axis=1)
+        t = step + ahead[np.arange(rel.size), entry] / rel_speed
+        
+        # 線形近似の誤差（数時間以内）で最早となりうる候補だけを実際の位置で補正
+        margin = 0.5
+        best = None
+        for k in np.flatnonzero(t <= min(t.min(), days_limit) + margin).tolist():
+            check_jd = julian_day + t[k]
+            moon_check = self.core.calculate_body(check_jd, PlanetId.MOON)
+            planet_check = self.core.calculate_body(check_jd, self.PLANETS_FOR_VOC[k])
+            target = self._RELATIVE_TARGETS[entry[k]] - orb
+            residual = (target - (moon_check['longitude'] - planet_check['longitude']) + 180) % 360 - 180
+            t_k = t[k] + residual / (moon_check['speed_long'] - planet_check['speed_long'])
+            if t_k <= days_limit + step and (best is None or t_k < best):
+                best = t_k
+        
+        if best is None:
+            return None
+        return max(1, math.ceil(best / step) - 1)
+    
+    def _major_aspect_kinds(self, moon_lon: float, planet_lons: np.ndarray) -> np.ndarray:
+        """
+        月と各惑星の間のメジャーアスペクトを一度の走査で判定（_check_major_aspectの配列版）
+        
+        Returns:
+            惑星ごとのアスペクトのインデックス（MAJOR_ASPECTSの順、なしは-1）
+        """
+        if NUMBA_AVAILABLE:
+            return major_aspect_kinds(moon_lon, planet_lons, self._MAJOR_ANGLES, self.MAJOR_ASPECT_ORB)
+        diff = np.abs(planet_lons - moon_lon)
+        diff = np.minimum(diff, 360 - diff)
+        within = np.abs(diff[:, None] - self._MAJOR_ANGLES) <= self.MAJOR_ASPECT_ORB
+        return np.where(within.any(axis=1), within.argmax(axis=1), -1)
+    
+    def _aspect_event(self, planet_index: int, kinds: np.ndarray, time_jd: float) -> Dict[str, Any]:
+        """last_aspect / next_aspect の出力形式"""
+        return {
+            "planet": self.PLANETS_FOR_VOC[planet_index].name,
+            "aspect_type": self._MAJOR_ASPECT_NAMES[kinds[planet_index]],
+            "time_jd": time_jd
+        }
+    
     def _check_major_aspect(self, moon_lon: float, planet_lon: float) -> str:
         """
         2つの黄経間でメジャーアスペクトが形成されているかチェック
@@ -332,21 +561,14 @@ class VoidOfCourseCalculator:
         if diff > 180:
             diff = 360 - diff
         
-        aspect_names = {
-            0: "Conjunction",
-            60: "Sextile",
-            90: "Square",
-            120: "Trine",
-            180: "Opposition"
-        }
-        
-        for angle, name in aspect_names.items():
+        # 角度と名前の対応はクラスで一度だけ定義したものを使う（呼び出しごとに辞書を作らない）
+        for angle, name in zip(self.MAJOR_ASPECTS, self._MAJOR_ASPECT_NAMES):
             if abs(diff - angle) <= self.MAJOR_ASPECT_ORB:
                 return name
         
         return None
 
 
-# シングルトンインスタンス（必要に応じて）
+# シングルトンインスタンス（VoidOfCourseCalculator・WesternAstrologyEngineの既定）
 default_core = AstroCore()
 
@@ -3,6 +3,24 @@ from typing import List, Dict, Any, Optional
 from ...const.astro_const import HouseSystem, PlanetId, SIGNS_EN, SIGNS_JP
 from .astro_core import AstroCore
 
+# チャートに含める天体（ノード・リリスは設定に応じて追加）
+_CHART_BODIES = (
+    PlanetId.SUN, PlanetId.MOON, PlanetId.MERCURY, PlanetId.VENUS, PlanetId.MARS,
+    PlanetId.JUPITER, PlanetId.SATURN, PlanetId.URANUS, PlanetId.NEPTUNE, PlanetId.PLUTO,
+    PlanetId.CHIRON
+)
+
+# 天体ID → 出力用のID文字列
+_BODY_NAMES = {
+    PlanetId.SUN: 'Sun', PlanetId.MOON: 'Moon', PlanetId.MERCURY: 'Mercury',
+    PlanetId.VENUS: 'Venus', PlanetId.MARS: 'Mars', PlanetId.JUPITER: 'Jupiter',
+    PlanetId.SATURN: 'Saturn', PlanetId.URANUS: 'Uranus', PlanetId.NEPTUNE: 'Neptune',
+    PlanetId.PLUTO: 'Pluto', PlanetId.CHIRON: 'Chiron',
+    PlanetId.TRUE_NODE: 'NorthNode', PlanetId.MEAN_NODE: 'NorthNode',
+    PlanetId.MEAN_APOGEE: 'Lilith', PlanetId.OSCU_APOGEE: 'Lilith'
+}
+
+
 class ChartBuilder:
     """
     ホロスコープチャート構築クラス
@@ -176,11 +194,6 @@ class ChartBuilder:
         
         # 2. 天体計算
         bodies = []
-        target_ids = [
-            PlanetId.SUN, PlanetId.MOON, PlanetId.MERCURY, PlanetId.VENUS, PlanetId.MARS,
-            PlanetId.JUPITER, PlanetId.SATURN, PlanetId.URANUS, PlanetId.NEPTUNE, PlanetId.PLUTO,
-            PlanetId.CHIRON
-        ]
         
         # ノード (True/Mean)
         node_id = PlanetId.TRUE_NODE if true_node else PlanetId.MEAN_NODE
@@ -188,7 +201,7 @@ class ChartBuilder:
         # リリス (True/Mean) - デフォルトはMeanが多いが、指定に合わせて
         lilith_id = PlanetId.MEAN_APOGEE 
         
-        all_targets = target_ids + [node_id, lilith_id]
+        all_targets = _CHART_BODIES + (node_id, lilith_id)
         
         for bid in all_targets:
             data = self.core.calculate_body(julian_day, bid, lat, lon, alt, topocentric)
@@ -196,16 +209,7 @@ class ChartBuilder:
             house_num = self._determine_house(data['longitude'], house_data['cusps'], five_deg_rule)
             
             # ID文字列化
-            name_map = {
-                PlanetId.SUN: 'Sun', PlanetId.MOON: 'Moon', PlanetId.MERCURY: 'Mercury',
-                PlanetId.VENUS: 'Venus', PlanetId.MARS: 'Mars', PlanetId.JUPITER: 'Jupiter',
-                PlanetId.SATURN: 'Saturn', PlanetId.URANUS: 'Uranus', PlanetId.NEPTUNE: 'Neptune',
-                PlanetId.PLUTO: 'Pluto', PlanetId.CHIRON: 'Chiron',
-                PlanetId.TRUE_NODE: 'NorthNode', PlanetId.MEAN_NODE: 'NorthNode',
-                PlanetId.MEAN_APOGEE: 'Lilith', PlanetId.OSCU_APOGEE: 'Lilith'
-            }
-            
-            body_name = name_map.get(bid, str(bid))
+            body_name = _BODY_NAMES.get(bid, str(bid))
             
             bodies.append({
                 "id": body_name,
@@ -10,7 +10,7 @@ from typing import Dict, Any
 
 try:
     from ...const.astro_const import HouseSystem
-    from .astro_core import AstroCore
+    from .astro_core import default_core
     from .horoscope_logic import ChartBuilder
     from .aspect_logic import AspectEngine
 except ImportError:
@@ -19,13 +19,14 @@ except ImportError:
     import os
     sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../')))
     from divination_engine.src.const.astro_const import HouseSystem
-    from divination_engine.src.modules.western.astro_core import AstroCore
+    from divination_engine.src.modules.western.astro_core import default_core
     from divination_engine.src.modules.western.horoscope_logic import ChartBuilder
     from divination_engine.src.modules.western.aspect_logic import AspectEngine
 
 class WesternAstrologyEngine:
     def __init__(self):
-        self.core = AstroCore()
+        # AstroCoreはモジュール共有のインスタンスを使う（エンジン生成ごとにエフェメリスを設定し直さない）
+        self.core = default_core
         self.builder = ChartBuilder(self.core)
         self.aspect_engine = AspectEngine()
         
@@ -0,0 +1,82 @@
+"""
+アスペクト計算のテスト
+"""
+import sys
+from pathlib import Path
+
+# プロジェクトルートを追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import random
+
+from src.modules.western.aspect_logic import AspectEngine, ASPECT_RECORD_DTYPE
+
+
+_NAMES = ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn',
+          'Uranus', 'Neptune', 'Pluto', 'Chiron', 'NorthNode', 'Lilith']
+
+
+def _random_bodies(rng, names):
+    return [
+        {'id': n, 'longitude': rng.uniform(0, 360), 'speed_long': rng.uniform(-1.5, 14)}
+        for n in names
+    ]
+
+
+def _assert_array_matches(engine, bodies):
+    """calculate_aspects_arrayがcalculate_aspects(rounded=False)と項目ごとに一致する"""
+    aspects = engine.calculate_aspects(bodies, rounded=False)
+    records = engine.calculate_aspects_array(bodies)
+
+    assert records.dtype == ASPECT_RECORD_DTYPE
+    assert len(records) == len(aspects)
+    for rec, asp in zip(records, aspects):
+        k = int(rec['aspect'])
+        assert bodies[rec['body_a']]['id'] == asp['body_a']
+        assert bodies[rec['body_b']]['id'] == asp['body_b']
+        assert engine._aspect_types[k] == asp['type']
+        assert engine._aspect_angles[k] == asp['angle']
+        assert rec['actual_angle'] == asp['actual_angle']
+        assert rec['orb'] == asp['orb']
+        assert ('Applying' if rec['applying'] else 'Separating') == asp['state']
+
+
+def test_calculate_aspects_array_matches_dicts():
+    """構造化配列と辞書リストの結果が一致する"""
+    engine = AspectEngine()
+    rng = random.Random(7)
+    for _ in range(300):
+        _assert_array_matches(engine, _random_bodies(rng, _NAMES))
+
+
+def test_calculate_aspects_array_skips_duplicate_ids():
+    """IDが重複する天体同士のアスペクトは両方の経路で除外される"""
+    engine = AspectEngine()
+    rng = random.Random(11)
+    names = _NAMES[:6] + ['Sun', 'Mars']
+    for _ in range(100):
+        bodies = _random_bodies(rng, names)
+        # 重複IDの組を確実にコンジャンクションにする
+        bodies[6]['longitude'] = bodies[0]['longitude']
+        _assert_array_matches(engine, bodies)
+        for rec in engine.calculate_aspects_array(bodies):
+            assert bodies[rec['body_a']]['id'] != bodies[rec['body_b']]['id']
+
+
+def test_known_aspects():
+    """定義順・状態判定の既知の例"""
+    engine = AspectEngine()
+    bodies = [
+        {'id': 'Sun', 'longitude': 10.0, 'speed_long': 1.0},
+        {'id': 'Moon', 'longitude': 128.0, 'speed_long': 13.0},
+        {'id': 'Saturn', 'longitude': 300.0, 'speed_long': 0.0},
+    ]
+    aspects = engine.calculate_aspects(bodies)
+    trine = [a for a in aspects if (a['body_a'], a['body_b']) == ('Sun', 'Moon')]
+    assert len(trine) == 1
+    assert trine[0]['angle'] == 120
+    assert trine[0]['orb'] == 2.0
+    # 月が速く118°から離れていく → 誤差が縮む（Applying）
+    assert trine[0]['state'] == 'Applying'
+    assert engine.calculate_aspects(bodies[:1]) == []
+    assert len(engine.calculate_aspects_array(bodies[:1])) == 0
@@ -0,0 +1,79 @@
+"""
+西洋占星術の天体位置計算（AstroCore）のテスト
+"""
+import sys
+from pathlib import Path
+
+# プロジェクトルートを追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import swisseph as swe
+
+from src.modules.western.astro_core import AstroCore
+
+
+_BODY_IDS = [swe.SUN, swe.MOON, swe.MERCURY, swe.VENUS, swe.MARS,
+             swe.JUPITER, swe.SATURN, swe.MEAN_NODE]
+# 小惑星ファイルがなければ計算に失敗し、ダミーの行（全項目0.0）になる
+_MISSING_BODY = swe.AST_OFFSET + 433
+_JULIAN_DAYS = [2451545.0 + 37.25 * i for i in range(12)]
+_FIELDS = ("longitude", "latitude", "distance", "speed_long", "declination", "right_ascension")
+
+
+def _assert_bodies_match_scalar(core, columns, julian_day, body_ids, **location):
+    """calculate_bodiesの各列がcalculate_bodyの結果と一致する"""
+    for k, body_id in enumerate(body_ids):
+        body = core.calculate_body(julian_day, body_id, **location)
+        for field in _FIELDS:
+            assert columns[field][k] == body[field]
+        assert bool(columns["is_retrograde"][k]) == body["is_retrograde"]
+        assert columns["sign_index"][k] == int(body["longitude"] // 30)
+        assert columns["sign_degree"][k] == body["longitude"] % 30
+
+
+def _assert_series_matches(core, body_ids, **location):
+    """calculate_bodies_seriesの各行がcalculate_bodies・calculate_bodyと一致する"""
+    series = core.calculate_bodies_series(_JULIAN_DAYS, body_ids, **location)
+    assert series["longitude"].shape == (len(_JULIAN_DAYS), len(body_ids))
+
+    for t, julian_day in enumerate(_JULIAN_DAYS):
+        columns = core.calculate_bodies(julian_day, body_ids, **location)
+        for field, values in columns.items():
+            assert np.array_equal(series[field][t], values)
+        _assert_bodies_match_scalar(core, columns, julian_day, body_ids, **location)
+
+
+def test_series_matches_scalar_geocentric():
+    """ジオセントリック（観測地点は無視される）"""
+    core = AstroCore()
+    _assert_series_matches(core, _BODY_IDS)
+    _assert_series_matches(core, _BODY_IDS, lat=35.68, lon=139.77, alt=40.0)
+
+
+def test_series_matches_scalar_topocentric():
+    """トポセントリック（観測地点ごとの結果）"""
+    core = AstroCore()
+    tokyo = dict(lat=35.68, lon=139.77, alt=40.0, topocentric=True)
+    delhi = dict(lat=28.61, lon=77.21, alt=216.0, topocentric=True)
+    _assert_series_matches(core, _BODY_IDS, **tokyo)
+    _assert_series_matches(core, _BODY_IDS, **delhi)
+
+    # 月は観測地点で位置が変わる
+    moon_tokyo = core.calculate_bodies(_JULIAN_DAYS[0], [swe.MOON], **tokyo)
+    moon_delhi = core.calculate_bodies(_JULIAN_DAYS[0], [swe.MOON], **delhi)
+    assert moon_tokyo["longitude"][0] != moon_delhi["longitude"][0]
+
+
+def test_series_keeps_dummy_rows_for_failed_bodies():
+    """計算に失敗した天体はcalculate_bodyと同じダミー値の行になる"""
+    core = AstroCore()
+    body_ids = [swe.SUN, _MISSING_BODY, swe.MOON]
+    _assert_series_matches(core, body_ids)
+
+    body = core.calculate_body(_JULIAN_DAYS[0], _MISSING_BODY)
+    if "error" in body:
+        series = core.calculate_bodies_series(_JULIAN_DAYS, body_ids)
+        for field in _FIELDS:
+            assert not series[field][:, 1].any()
+        assert series["longitude"][:, 0].all()
@@ -0,0 +1,54 @@
+"""
+マヤ暦計算のテスト
+"""
+import sys
+from pathlib import Path
+
+# プロジェクトルートを追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from src.modules.mayan.mayan import MayanCalculator, MayanMode
+
+
+def _scalar_results(calc, start, n_days, mode):
+    """1日ずつcalculate_fullで計算した結果"""
+    results = []
+    for i in range(n_days):
+        # 正午UTCなら日の出切り替え・タイムゾーン変換の影響を受けない
+        dt = datetime.combine(start + timedelta(days=i), datetime.min.time(), timezone.utc)
+        results.append(calc.calculate_full(dt.replace(hour=12), mode))
+    return results
+
+
+def test_calculate_batch_matches_scalar():
+    """バッチ計算が1日ずつの計算と一致する"""
+    calc = MayanCalculator()
+    start = datetime(1980, 1, 1).date()
+    n_days = 366 * 12
+    dates = np.arange(np.datetime64(start), np.datetime64(start) + n_days)
+
+    for mode in MayanMode:
+        batch = calc.calculate_batch(dates, mode)
+        scalar = _scalar_results(calc, start, n_days, mode)
+
+        for i, r in enumerate(scalar):
+            assert bool(batch["is_hunab_ku"][i]) == r.is_hunab_ku
+            if r.is_hunab_ku:
+                assert batch["kin"][i] == 0
+                continue
+            assert batch["kin"][i] == r.kin_number
+            assert calc.SOLAR_SEALS[batch["seal_index"][i]] == r.solar_seal
+            assert batch["tone"][i] == r.galactic_tone
+            assert calc.WAVESPELLS[batch["wavespell_index"][i]] == r.wavespell
+            assert bool(batch["is_gap_kin"][i]) == r.is_gap_kin
+
+
+def test_dreamspell_epoch_is_kin_1():
+    """ドリームスペル基準日はKIN 1"""
+    calc = MayanCalculator()
+    batch = calc.calculate_batch(["1987-07-26"], MayanMode.DREAMSPELL)
+    assert batch["kin"][0] == 1
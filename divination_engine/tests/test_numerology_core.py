@@ -138,7 +138,9 @@ def test_japanese_romaji():
         ("やまだ", "YAMADA"),
         ("たろう", "TAROU"),
         ("ヤマダ", "YAMADA"),
-        ("タロウ", "TAROU")
+        ("タロウ", "TAROU"),
+        ("りょうこ", "RYOUKO"),
+        ("ジュン", "JUN")
     ]
     
     all_passed = True
@@ -0,0 +1,28 @@
+"""
+姓名判断計算のテスト
+"""
+import sys
+from pathlib import Path
+
+# プロジェクトルートを追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.modules.name_analysis.seimei import SeimeiCalculator
+
+
+def test_calculate_batch_matches_scalar():
+    """一括計算が1件ずつの計算と一致する（霊数・未登録文字・BMP外の文字を含む）"""
+    calc = SeimeiCalculator()
+    names = [
+        ("安瀬", "諒"), ("佐藤", "健太郎"), ("高", "明"),
+        ("村井", "恵"), ("𠮷田", "真"), ("山", "xyz")
+    ]
+    batch = calc.calculate_batch(names)
+
+    for i, (family, given) in enumerate(names):
+        r = calc.calculate(family, given)
+        assert batch["tenkaku"][i] == r.tenkaku
+        assert batch["jinkaku"][i] == r.jinkaku
+        assert batch["chikaku"][i] == r.chikaku
+        assert batch["gaikaku"][i] == r.gaikaku
+        assert batch["soukaku"][i] == r.soukaku